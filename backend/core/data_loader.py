@@ -516,8 +516,8 @@ def fetch_crypto_recent_from_coingecko(symbol: str, days: int = 365) -> pd.DataF
     # CoinGecko market_chart only provides close prices
     # Use close price for all OHLC columns (approximation)
     df['Open'] = df['price'].shift(1).fillna(df['price'])  # Use previous close as open
-    df['High'] = df[['Open', 'price']].max(axis=1)  # Approximate high
-    df['Low'] = df[['Open', 'price']].min(axis=1)  # Approximate low
+    df['High'] = np.fmax(df['Open'], df['price'])  # Approximate high
+    df['Low'] = np.fmin(df['Open'], df['price'])  # Approximate low
     df['Close'] = df['price']
     
     # Try to get volume data
@@ -13,59 +13,79 @@ Set GLASSNODE_API_KEY environment variable to use these indicators.
 
 import pandas as pd
 import numpy as np
-from typing import Optional
+from typing import List, Optional, Union
 import logging
 from datetime import datetime
+from enum import IntEnum
 
 from .glassnode_client import get_glassnode_client
 
 logger = logging.getLogger(__name__)
 
 
-def calculate_mvrv(df: pd.DataFrame) -> pd.Series:
+def _fetch_aligned_metric(df: pd.DataFrame, fetch_method: str, label: str, fill_value: float) -> pd.Series:
     """
-    Calculate Market Value to Realized Value (MVRV) ratio.
-    
-    MVRV compares the market cap to the realized cap, indicating whether
-    Bitcoin is overvalued or undervalued relative to its on-chain value.
+    Fetch a Glassnode metric and align it to the DataFrame's date index.
     
     Args:
         df: DataFrame with OHLCV data and Date index
+        fetch_method: Name of the GlassnodeClient getter (e.g., 'get_mvrv')
+        label: Human-readable indicator name used in logs and errors
+        fill_value: Value used for dates still missing after ffill/bfill
         
     Returns:
-        Pandas Series with MVRV values from Glassnode API
+        Pandas Series with metric values aligned to df.index
         
     Raises:
-        ValueError: If Glassnode API is unavailable or API key is missing
+        ValueError: If Glassnode API is unavailable, returns no data, or the
+            data covers less than half of the requested dates
     """
     dates = df.index
+    if len(dates) == 0:
+        return pd.Series([], index=dates, dtype=float)
     start_date = dates.min()
     end_date = dates.max()
     
-    # Try to fetch from Glassnode
     try:
         client = get_glassnode_client()
-        mvrv_data = client.get_mvrv("BTC", start_date, end_date, use_cache=True)
+        data = getattr(client, fetch_method)("BTC", start_date, end_date, use_cache=True)
         
-        if len(mvrv_data) > 0:
+        if len(data) > 0:
             # Align with DataFrame index
-            aligned = mvrv_data.reindex(dates, method='ffill')
+            aligned = data.reindex(dates, method='ffill')
             aligned = aligned.bfill()
             
             # Validate data
             if aligned.notna().sum() > len(dates) * 0.5:  # At least 50% valid data
-                logger.info(f"Using real MVRV data from Glassnode: {len(mvrv_data)} data points")
-                return aligned.fillna(1.0)  # Fill remaining NaN with neutral value
+                logger.info(f"Using real {label} data from Glassnode: {len(data)} data points")
+                return aligned.fillna(fill_value)
             else:
-                raise ValueError("Glassnode MVRV data has too many gaps")
+                raise ValueError(f"Glassnode {label} data has too many gaps. Data quality insufficient.")
         else:
-            raise ValueError("No MVRV data from Glassnode")
-    except ValueError:
-        raise
+            raise ValueError(f"No {label} data returned from Glassnode API.")
     except Exception as e:
         # No fallback - require Glassnode API
-        logger.error(f"Error fetching MVRV from Glassnode: {e}")
-        raise ValueError(f"MVRV requires Glassnode API key. Set GLASSNODE_API_KEY environment variable. Error: {e}")
+        logger.error(f"Error fetching {label} from Glassnode: {e}")
+        raise ValueError(f"{label} requires Glassnode API key. Set GLASSNODE_API_KEY environment variable. Error: {e}")
+
+
+def calculate_mvrv(df: pd.DataFrame) -> pd.Series:
+    """
+    Calculate Market Value to Realized Value (MVRV) ratio.
+    
+    MVRV compares the market cap to the realized cap, indicating whether
+    Bitcoin is overvalued or undervalued relative to its on-chain value.
+    
+    Args:
+        df: DataFrame with OHLCV data and Date index
+        
+    Returns:
+        Pandas Series with MVRV values from Glassnode API
+        
+    Raises:
+        ValueError: If Glassnode API is unavailable or API key is missing
+    """
+    return _fetch_aligned_metric(df, 'get_mvrv', 'MVRV', 1.0)
 
 
 def calculate_nupl(df: pd.DataFrame) -> pd.Series:
@@ -84,32 +104,7 @@ def calculate_nupl(df: pd.DataFrame) -> pd.Series:
     Raises:
         ValueError: If Glassnode API is unavailable or API key is missing
     """
-    dates = df.index
-    start_date = dates.min()
-    end_date = dates.max()
-    
-    # Try to fetch from Glassnode
-    try:
-        client = get_glassnode_client()
-        nupl_data = client.get_nupl("BTC", start_date, end_date, use_cache=True)
-        
-        if len(nupl_data) > 0:
-            # Align with DataFrame index
-            aligned = nupl_data.reindex(dates, method='ffill')
-            aligned = aligned.bfill()
-            
-            # Validate data
-            if aligned.notna().sum() > len(dates) * 0.5:
-                logger.info(f"Using real NUPL data from Glassnode: {len(nupl_data)} data points")
-                return aligned.fillna(0.0)
-            else:
-                raise ValueError("Glassnode NUPL data has too many gaps. Data quality insufficient.")
-        else:
-            raise ValueError("No NUPL data returned from Glassnode API.")
-    except Exception as e:
-        # No fallback - require Glassnode API
-        logger.error(f"Error fetching NUPL from Glassnode: {e}")
-        raise ValueError(f"NUPL requires Glassnode API key. Set GLASSNODE_API_KEY environment variable. Error: {e}")
+    return _fetch_aligned_metric(df, 'get_nupl', 'NUPL', 0.0)
 
 
 def calculate_bitcoin_thermocap(df: pd.DataFrame) -> pd.Series:
@@ -129,32 +124,7 @@ def calculate_bitcoin_thermocap(df: pd.DataFrame) -> pd.Series:
     Raises:
         ValueError: If Glassnode API is unavailable or API key is missing
     """
-    dates = df.index
-    start_date = dates.min()
-    end_date = dates.max()
-    
-    # Try to fetch from Glassnode
-    try:
-        client = get_glassnode_client()
-        thermocap_data = client.get_thermocap("BTC", start_date, end_date, use_cache=True)
-        
-        if len(thermocap_data) > 0:
-            # Align with DataFrame index
-            aligned = thermocap_data.reindex(dates, method='ffill')
-            aligned = aligned.bfill()
-            
-            # Validate data
-            if aligned.notna().sum() > len(dates) * 0.5:
-                logger.info(f"Using real Bitcoin Thermocap data from Glassnode: {len(thermocap_data)} data points")
-                return aligned.fillna(0.0)
-            else:
-                raise ValueError("Glassnode Bitcoin Thermocap data has too many gaps. Data quality insufficient.")
-        else:
-            raise ValueError("No Bitcoin Thermocap data returned from Glassnode API.")
-    except Exception as e:
-        # No fallback - require Glassnode API
-        logger.error(f"Error fetching Bitcoin Thermocap from Glassnode: {e}")
-        raise ValueError(f"Bitcoin Thermocap requires Glassnode API key. Set GLASSNODE_API_KEY environment variable. Error: {e}")
+    return _fetch_aligned_metric(df, 'get_thermocap', 'Bitcoin Thermocap', 0.0)
 
 
 def calculate_cvdd(df: pd.DataFrame) -> pd.Series:
@@ -173,32 +143,7 @@ def calculate_cvdd(df: pd.DataFrame) -> pd.Series:
     Raises:
         ValueError: If Glassnode API is unavailable or API key is missing
     """
-    dates = df.index
-    start_date = dates.min()
-    end_date = dates.max()
-    
-    # Try to fetch from Glassnode
-    try:
-        client = get_glassnode_client()
-        cvdd_data = client.get_cvdd("BTC", start_date, end_date, use_cache=True)
-        
-        if len(cvdd_data) > 0:
-            # Align with DataFrame index
-            aligned = cvdd_data.reindex(dates, method='ffill')
-            aligned = aligned.bfill()
-            
-            # Validate data
-            if aligned.notna().sum() > len(dates) * 0.5:
-                logger.info(f"Using real CVDD data from Glassnode: {len(cvdd_data)} data points")
-                return aligned.fillna(0.0)
-            else:
-                raise ValueError("Glassnode CVDD data has too many gaps. Data quality insufficient.")
-        else:
-            raise ValueError("No CVDD data returned from Glassnode API.")
-    except Exception as e:
-        # No fallback - require Glassnode API
-        logger.error(f"Error fetching CVDD from Glassnode: {e}")
-        raise ValueError(f"CVDD requires Glassnode API key. Set GLASSNODE_API_KEY environment variable. Error: {e}")
+    return _fetch_aligned_metric(df, 'get_cvdd', 'CVDD', 0.0)
 
 
 def calculate_puell_multiple(df: pd.DataFrame) -> pd.Series:
@@ -218,32 +163,7 @@ def calculate_puell_multiple(df: pd.DataFrame) -> pd.Series:
     Raises:
         ValueError: If Glassnode API is unavailable or API key is missing
     """
-    dates = df.index
-    start_date = dates.min()
-    end_date = dates.max()
-    
-    # Try to fetch from Glassnode
-    try:
-        client = get_glassnode_client()
-        puell_data = client.get_puell_multiple("BTC", start_date, end_date, use_cache=True)
-        
-        if len(puell_data) > 0:
-            # Align with DataFrame index
-            aligned = puell_data.reindex(dates, method='ffill')
-            aligned = aligned.bfill()
-            
-            # Validate data
-            if aligned.notna().sum() > len(dates) * 0.5:
-                logger.info(f"Using real Puell Multiple data from Glassnode: {len(puell_data)} data points")
-                return aligned.fillna(1.0)
-            else:
-                raise ValueError("Glassnode Puell Multiple data has too many gaps. Data quality insufficient.")
-        else:
-            raise ValueError("No Puell Multiple data returned from Glassnode API.")
-    except Exception as e:
-        # No fallback - require Glassnode API
-        logger.error(f"Error fetching Puell Multiple from Glassnode: {e}")
-        raise ValueError(f"Puell Multiple requires Glassnode API key. Set GLASSNODE_API_KEY environment variable. Error: {e}")
+    return _fetch_aligned_metric(df, 'get_puell_multiple', 'Puell Multiple', 1.0)
 
 
 def calculate_reserve_risk(df: pd.DataFrame) -> pd.Series:
@@ -262,32 +182,7 @@ def calculate_reserve_risk(df: pd.DataFrame) -> pd.Series:
     Raises:
         ValueError: If Glassnode API is unavailable or API key is missing
     """
-    dates = df.index
-    start_date = dates.min()
-    end_date = dates.max()
-    
-    # Try to fetch from Glassnode
-    try:
-        client = get_glassnode_client()
-        reserve_risk_data = client.get_reserve_risk("BTC", start_date, end_date, use_cache=True)
-        
-        if len(reserve_risk_data) > 0:
-            # Align with DataFrame index
-            aligned = reserve_risk_data.reindex(dates, method='ffill')
-            aligned = aligned.bfill()
-            
-            # Validate data
-            if aligned.notna().sum() > len(dates) * 0.5:
-                logger.info(f"Using real Reserve Risk data from Glassnode: {len(reserve_risk_data)} data points")
-                return aligned.fillna(0.02)
-            else:
-                raise ValueError("Glassnode Reserve Risk data has too many gaps. Data quality insufficient.")
-        else:
-            raise ValueError("No Reserve Risk data returned from Glassnode API.")
-    except Exception as e:
-        # No fallback - require Glassnode API
-        logger.error(f"Error fetching Reserve Risk from Glassnode: {e}")
-        raise ValueError(f"Reserve Risk requires Glassnode API key. Set GLASSNODE_API_KEY environment variable. Error: {e}")
+    return _fetch_aligned_metric(df, 'get_reserve_risk', 'Reserve Risk', 0.02)
 
 
 def calculate_bitcoin_days_destroyed(df: pd.DataFrame) -> pd.Series:
@@ -306,32 +201,7 @@ def calculate_bitcoin_days_destroyed(df: pd.DataFrame) -> pd.Series:
     Raises:
         ValueError: If Glassnode API is unavailable or API key is missing
     """
-    dates = df.index
-    start_date = dates.min()
-    end_date = dates.max()
-    
-    # Try to fetch from Glassnode
-    try:
-        client = get_glassnode_client()
-        bdd_data = client.get_days_destroyed("BTC", start_date, end_date, use_cache=True)
-        
-        if len(bdd_data) > 0:
-            # Align with DataFrame index
-            aligned = bdd_data.reindex(dates, method='ffill')
-            aligned = aligned.bfill()
-            
-            # Validate data
-            if aligned.notna().sum() > len(dates) * 0.5:
-                logger.info(f"Using real Bitcoin Days Destroyed data from Glassnode: {len(bdd_data)} data points")
-                return aligned.fillna(0.0)
-            else:
-                raise ValueError("Glassnode Bitcoin Days Destroyed data has too many gaps. Data quality insufficient.")
-        else:
-            raise ValueError("No Bitcoin Days Destroyed data returned from Glassnode API.")
-    except Exception as e:
-        # No fallback - require Glassnode API
-        logger.error(f"Error fetching Bitcoin Days Destroyed from Glassnode: {e}")
-        raise ValueError(f"Bitcoin Days Destroyed requires Glassnode API key. Set GLASSNODE_API_KEY environment variable. Error: {e}")
+    return _fetch_aligned_metric(df, 'get_days_destroyed', 'Bitcoin Days Destroyed', 0.0)
 
 
 def calculate_exchange_net_position(df: pd.DataFrame) -> pd.Series:
@@ -350,32 +220,7 @@ def calculate_exchange_net_position(df: pd.DataFrame) -> pd.Series:
     Raises:
         ValueError: If Glassnode API is unavailable or API key is missing
     """
-    dates = df.index
-    start_date = dates.min()
-    end_date = dates.max()
-    
-    # Try to fetch from Glassnode
-    try:
-        client = get_glassnode_client()
-        exchange_data = client.get_exchange_netflows("BTC", start_date, end_date, use_cache=True)
-        
-        if len(exchange_data) > 0:
-            # Align with DataFrame index
-            aligned = exchange_data.reindex(dates, method='ffill')
-            aligned = aligned.bfill()
-            
-            # Validate data
-            if aligned.notna().sum() > len(dates) * 0.5:
-                logger.info(f"Using real Exchange Net Position data from Glassnode: {len(exchange_data)} data points")
-                return aligned.fillna(0.0)
-            else:
-                logger.warning("Glassnode Exchange Net Position data has too many gaps, falling back to stub data")
-        else:
-            logger.warning("No Exchange Net Position data from Glassnode, falling back to stub data")
-    except Exception as e:
-        # No fallback - require Glassnode API
-        logger.error(f"Error fetching Exchange Net Position from Glassnode: {e}")
-        raise ValueError(f"Exchange Net Position requires Glassnode API key. Set GLASSNODE_API_KEY environment variable. Error: {e}")
+    return _fetch_aligned_metric(df, 'get_exchange_netflows', 'Exchange Net Position', 0.0)
 
 
 def calculate_sopr(df: pd.DataFrame) -> pd.Series:
@@ -391,31 +236,7 @@ def calculate_sopr(df: pd.DataFrame) -> pd.Series:
     Returns:
         Pandas Series with SOPR values from Glassnode API (or raises error if API unavailable)
     """
-    dates = df.index
-    start_date = dates.min()
-    end_date = dates.max()
-    
-    # Fetch from Glassnode
-    try:
-        client = get_glassnode_client()
-        sopr_data = client.get_sopr("BTC", start_date, end_date, use_cache=True)
-        
-        if len(sopr_data) > 0:
-            # Align with DataFrame index
-            aligned = sopr_data.reindex(dates, method='ffill')
-            aligned = aligned.bfill()
-            
-            # Validate data
-            if aligned.notna().sum() > len(dates) * 0.5:
-                logger.info(f"Using real SOPR data from Glassnode: {len(sopr_data)} data points")
-                return aligned.fillna(1.0)  # Neutral value
-            else:
-                raise ValueError("Glassnode SOPR data has too many gaps")
-        else:
-            raise ValueError("No SOPR data from Glassnode")
-    except Exception as e:
-        logger.error(f"Error fetching SOPR from Glassnode: {e}")
-        raise ValueError(f"SOPR requires Glassnode API key. Set GLASSNODE_API_KEY environment variable. Error: {e}")
+    return _fetch_aligned_metric(df, 'get_sopr', 'SOPR', 1.0)
 
 
 # Mapping of indicator IDs to calculation functions
@@ -433,13 +254,31 @@ FUNDAMENTAL_INDICATORS = {
 }
 
 
-def get_fundamental_indicator(df: pd.DataFrame, indicator_id: str) -> pd.Series:
+class FundamentalIndicatorID(IntEnum):
+    """Integer IDs for fundamental indicators, in FUNDAMENTAL_INDICATORS order."""
+    MVRV = 0
+    BITCOIN_THERMOCAP = 1
+    NUPL = 2
+    CVDD = 3
+    PUELL_MULTIPLE = 4
+    RESERVE_RISK = 5
+    BITCOIN_DAYS_DESTROYED = 6
+    EXCHANGE_NET_POSITION = 7
+    SOPR = 8
+
+
+# Dispatch table indexed by FundamentalIndicatorID for callers in tight loops
+_FUNDAMENTAL_FNS = tuple(FUNDAMENTAL_INDICATORS.values())
+
+
+def get_fundamental_indicator(df: pd.DataFrame, indicator_id: Union[str, FundamentalIndicatorID]) -> pd.Series:
     """
     Get a fundamental indicator by ID.
     
     Args:
         df: DataFrame with OHLCV data and Date index
-        indicator_id: Indicator identifier (e.g., 'mvrv', 'nupl')
+        indicator_id: Indicator identifier (e.g., 'mvrv', 'nupl') or a
+            FundamentalIndicatorID, which skips the string lookup
         
     Returns:
         Pandas Series with indicator values
@@ -447,7 +286,43 @@ def get_fundamental_indicator(df: pd.DataFrame, indicator_id: str) -> pd.Series:
     Raises:
         ValueError: If indicator_id is not found
     """
+    if isinstance(indicator_id, FundamentalIndicatorID):
+        return _FUNDAMENTAL_FNS[indicator_id](df)
+    
     if indicator_id not in FUNDAMENTAL_INDICATORS:
         raise ValueError(f"Unknown fundamental indicator: {indicator_id}")
     
     return FUNDAMENTAL_INDICATORS[indicator_id](df)
+
+
+def get_fundamental_indicators(df: pd.DataFrame, indicator_ids: List[str]) -> pd.DataFrame:
+    """
+    Get several fundamental indicators in one call.
+    
+    All IDs are validated before any Glassnode request is made, so an unknown
+    ID fails fast instead of after the other metrics have been fetched.
+    Duplicate IDs are computed once.
+    
+    Args:
+        df: DataFrame with OHLCV data and Date index
+        indicator_ids: Indicator identifiers (e.g., ['mvrv', 'nupl'])
+        
+    Returns:
+        DataFrame indexed like df with one column per indicator ID
+        
+    Raises:
+        ValueError: If any indicator_id is not found
+    """
+    unknown = [indicator_id for indicator_id in indicator_ids if indicator_id not in FUNDAMENTAL_INDICATORS]
+    if unknown:
+        raise ValueError(f"Unknown fundamental indicator(s): {', '.join(unknown)}")
+    
+    ordered_ids = list(dict.fromkeys(indicator_ids))
+    
+    # Every calculator returns values aligned to df.index, so write them into
+    # one (n, k) buffer and wrap it without per-column alignment or copying.
+    values = np.empty((len(df.index), len(ordered_ids)), dtype=float)
+    for col, indicator_id in enumerate(ordered_ids):
+        values[:, col] = FUNDAMENTAL_INDICATORS[indicator_id](df).to_numpy(dtype=float)
+    
+    return pd.DataFrame(values, index=df.index, columns=ordered_ids, copy=False)
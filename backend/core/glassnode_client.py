@@ -7,15 +7,27 @@ including rate limiting, authentication, caching, and error handling.
 
 import os
 import time
+import calendar
 import logging
+import pickle
+import sqlite3
+import threading
+from functools import cache, lru_cache
+from operator import itemgetter
 import requests
-from typing import Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
-from collections import deque
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 import pandas as pd
 import numpy as np
-import hashlib
 import json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -23,59 +35,111 @@ logger = logging.getLogger(__name__)
 GLASSNODE_BASE_URL = "https://api.glassnode.com"
 GLASSNODE_API_KEY = os.getenv("GLASSNODE_API_KEY", "")
 
+# Optional SQLite file backing a persistent second cache tier, so cached
+# responses survive restarts. Disabled when unset.
+GLASSNODE_CACHE_PATH = os.getenv("GLASSNODE_CACHE_PATH", "")
+
 # Rate limiting: Free tier typically has limits (check current limits)
 # Conservative defaults: 100 requests/hour
 RATE_LIMIT_REQUESTS = 100
 RATE_LIMIT_WINDOW = 3600  # 1 hour in seconds
 
+# Returned by GlassnodeClient._make_request when a conditional request gets 304
+NOT_MODIFIED = object()
+
+# Extracts (timestamp, value) from a Glassnode record: {"t": ..., "v": ...}
+_record_fields = itemgetter('t', 'v')
+
+# Concurrent metric fetches (get_metrics); also sizes the HTTP connection pool
+MAX_CONCURRENT_REQUESTS = 8
+
 
 class RateLimiter:
-    """Token bucket rate limiter for Glassnode API requests."""
+    """Token bucket rate limiter for Glassnode API requests (thread-safe)."""
     
     def __init__(self, max_requests: int = RATE_LIMIT_REQUESTS, window_seconds: int = RATE_LIMIT_WINDOW):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.request_times = deque()
-        self.lock = False
+        # Bucket holds up to max_requests tokens, refilled continuously so that
+        # max_requests tokens accrue over window_seconds
+        self.rate = max_requests / window_seconds
+        self.tokens = float(max_requests)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()  # Guards tokens/last_refill
+        self._token_available = threading.Condition(self.lock)
+    
+    def _refill(self):
+        """Add the tokens accrued since the last refill. Caller holds the lock."""
+        now = time.monotonic()
+        self.tokens = min(self.max_requests, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    def _try_consume(self) -> bool:
+        """Take one token if available. Caller holds the lock."""
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+    
+    def _compute_wait(self) -> float:
+        """Seconds until one token will have accrued. Caller holds the lock."""
+        return max(0.0, (1 - self.tokens) / self.rate)
     
     def wait_if_needed(self):
-        """Wait if rate limit would be exceeded."""
-        now = time.time()
-        
-        # Remove requests outside the time window
-        while self.request_times and self.request_times[0] < now - self.window_seconds:
-            self.request_times.popleft()
-        
-        # If we're at the limit, wait until the oldest request expires
-        if len(self.request_times) >= self.max_requests:
-            wait_time = self.window_seconds - (now - self.request_times[0]) + 0.1
-            if wait_time > 0:
-                logger.warning(f"Rate limit reached ({self.max_requests} requests/hour). Waiting {wait_time:.2f} seconds...")
-                time.sleep(wait_time)
-                # Clean up again after waiting
-                now = time.time()
-                while self.request_times and self.request_times[0] < now - self.window_seconds:
-                    self.request_times.popleft()
-        
-        # Record this request
-        self.request_times.append(time.time())
+        """Wait if rate limit would be exceeded (thread-safe)."""
+        with self._token_available:
+            if not self._try_consume():
+                logger.warning(f"Rate limit reached ({self.max_requests} requests/hour). Waiting {self._compute_wait():.2f} seconds...")
+                # wait_for re-checks the bucket on every wake-up, whether from
+                # a notify or the timeout, so waiters never oversleep a refill
+                while not self._token_available.wait_for(self._try_consume, timeout=self._compute_wait()):
+                    pass
+            
+            # Tokens left over: wake the other waiters to re-check the bucket
+            if self.tokens >= 1:
+                self._token_available.notify_all()
     
     def get_remaining_requests(self) -> int:
-        """Get number of remaining requests in current window."""
-        now = time.time()
-        while self.request_times and self.request_times[0] < now - self.window_seconds:
-            self.request_times.popleft()
-        return max(0, self.max_requests - len(self.request_times))
+        """Get number of requests that can be made without waiting (thread-safe)."""
+        with self.lock:
+            self._refill()
+            return int(self.tokens)
 
 
 # Global rate limiter instance
 _rate_limiter = RateLimiter()
 
-# In-memory cache for Glassnode API responses
-# Structure: {cache_key: (dataframe, timestamp)}
+# Response cache keys: (metric, asset, interval, start epoch, end epoch, precision)
+CacheKey = Tuple[str, str, str, Optional[int], Optional[int], str]
+
+
+class _CacheEntry(NamedTuple):
+    """Cached metric arrays plus the HTTP validators needed to revalidate them."""
+    index: pd.DatetimeIndex
+    values: np.ndarray
+    timestamp: float  # time.monotonic() when stored
+    validators: Dict[str, str]  # ETag / Last-Modified response headers
+
+
 # TTL: 24 hours for all data (on-chain data doesn't change frequently)
-_glassnode_cache: Dict[str, Tuple[pd.DataFrame, float]] = {}
 CACHE_TTL = 86400  # 24 hours
+CACHE_MAXSIZE = 1024
+
+# Empty responses (unsupported asset, range outside history, plan limits) are
+# cached briefly so repeated calls don't spend rate-limit budget
+NEGATIVE_CACHE_TTL = 3600  # 1 hour
+
+# Value dtypes for get_metric's precision argument. float64 is the default;
+# float32 halves cache memory and is an opt-in for bounded ratio metrics, whose
+# few significant digits it keeps. Large cumulative series (thermocap, CVDD,
+# cumulative days destroyed) need float64: their float32 spacing is thousands
+# of units, which swamps day-over-day changes
+PRECISION_DTYPES = {'f32': np.float32, 'f64': np.float64}
+
+# Response headers stored for conditional requests, with the request
+# header each one is sent back as
+VALIDATOR_HEADERS = {'ETag': 'If-None-Match', 'Last-Modified': 'If-Modified-Since'}
 
 
 def _generate_cache_key(
@@ -83,102 +147,504 @@ def _generate_cache_key(
     asset: str,
     start_date: Optional[datetime],
     end_date: Optional[datetime],
-    interval: str = "24h"
-) -> str:
+    interval: str = "24h",
+    precision: str = "f64"
+) -> CacheKey:
     """
     Generate a cache key for Glassnode API requests.
     
+    Dates are snapped to the interval grid and reduced to the same epoch
+    seconds sent as request parameters, so requests that differ only by
+    wall-clock jitter share a key. The tuple is used directly as the dict
+    key; no hashing needed.
+    
     Args:
         metric: Metric endpoint name
         asset: Asset symbol (e.g., "BTC")
         start_date: Start date
         end_date: End date
         interval: Time interval
+        precision: Value precision ("f32" or "f64")
         
     Returns:
-        MD5 hash string for cache key
+        Tuple of (metric, asset, interval, start epoch, end epoch, precision)
+    """
+    return (
+        metric,
+        asset,
+        interval,
+        _to_epoch(start_date, interval) if start_date else None,
+        _to_epoch(end_date, interval) if end_date else None,
+        precision,
+    )
+
+
+# Intervals whose data points sit on UTC day boundaries
+DAILY_INTERVALS = frozenset({"24h", "1w", "1month"})
+
+
+@lru_cache(maxsize=1024)
+def _date_to_epoch(year: int, month: int, day: int) -> int:
+    """Return epoch seconds for UTC midnight of the given date."""
+    return calendar.timegm((year, month, day, 0, 0, 0))
+
+
+def _snap_to_interval(date: datetime, interval: str) -> datetime:
     """
-    key_string = f"{metric}_{asset}_{interval}"
-    if start_date:
-        key_string += f"_{start_date.strftime('%Y-%m-%d')}"
-    if end_date:
-        key_string += f"_{end_date.strftime('%Y-%m-%d')}"
+    Floor a date to the start of its interval bucket.
     
-    return hashlib.md5(key_string.encode()).hexdigest()
+    Args:
+        date: Date to snap
+        interval: Time interval
+        
+    Returns:
+        Midnight for daily-or-coarser intervals, top of the hour for "1h",
+        otherwise the start of the minute
+    """
+    if interval in DAILY_INTERVALS:
+        return date.replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval == "1h":
+        return date.replace(minute=0, second=0, microsecond=0)
+    return date.replace(second=0, microsecond=0)
 
 
-def _get_cached_response(cache_key: str) -> Optional[pd.DataFrame]:
+def _to_epoch(date: datetime, interval: str) -> int:
     """
-    Get cached response if available and not expired.
+    Convert a request date to epoch seconds for the 's'/'u' parameters.
+    
+    The date is first snapped to the interval grid. Daily-or-coarser
+    intervals use the (memoized) UTC midnight of the date. Naive dates are
+    taken as UTC for every interval, so epochs (and cache keys) do not depend
+    on the host's local timezone.
     
     Args:
-        cache_key: Cache key
+        date: Request start or end date
+        interval: Time interval
         
     Returns:
-        Cached DataFrame if available and fresh, None otherwise
+        Epoch seconds
+    """
+    if interval in DAILY_INTERVALS:
+        return _date_to_epoch(date.year, date.month, date.day)
+    snapped = _snap_to_interval(date, interval)
+    if snapped.tzinfo is None:
+        snapped = snapped.replace(tzinfo=timezone.utc)
+    return int(snapped.timestamp())
+
+
+# One SQLite connection per thread (connections can't be shared across
+# threads), reopened if GLASSNODE_CACHE_PATH changes; the schema is created
+# once per path
+_disk_cache_local = threading.local()
+_disk_cache_schema_paths = set()
+_disk_cache_schema_lock = threading.Lock()
+
+
+def _disk_cache_connect() -> Optional[sqlite3.Connection]:
+    """
+    Get this thread's connection to the persistent cache database, if configured.
+    
+    Returns:
+        SQLite connection, or None if GLASSNODE_CACHE_PATH is unset
     """
-    if cache_key in _glassnode_cache:
-        df, timestamp = _glassnode_cache[cache_key]
-        age = time.time() - timestamp
+    if not GLASSNODE_CACHE_PATH:
+        return None
+    
+    conn = getattr(_disk_cache_local, 'conn', None)
+    if conn is not None and _disk_cache_local.path == GLASSNODE_CACHE_PATH:
+        return conn
+    
+    _disk_cache_disconnect()
+    conn = sqlite3.connect(GLASSNODE_CACHE_PATH, timeout=5)
+    with _disk_cache_schema_lock:
+        if GLASSNODE_CACHE_PATH not in _disk_cache_schema_paths:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS glassnode_cache ("
+                    "cache_key TEXT PRIMARY KEY, stored_at REAL NOT NULL, payload BLOB NOT NULL)"
+                )
+            _disk_cache_schema_paths.add(GLASSNODE_CACHE_PATH)
+    
+    _disk_cache_local.conn = conn
+    _disk_cache_local.path = GLASSNODE_CACHE_PATH
+    return conn
+
+
+def _disk_cache_disconnect():
+    """Close this thread's persistent cache connection, if open."""
+    conn = getattr(_disk_cache_local, 'conn', None)
+    _disk_cache_local.conn = None
+    if conn is not None:
+        conn.close()
+
+
+def _load_disk_cached_response(cache_key: CacheKey) -> Optional[Tuple[_CacheEntry, float]]:
+    """
+    Load a fresh response from the persistent cache tier.
+    
+    A row that cannot be unpickled (truncated write, or a pickle from another
+    pandas/numpy version) is deleted and treated as a miss.
+    
+    Args:
+        cache_key: Cache key
         
-        if age < CACHE_TTL:
-            logger.debug(f"Using cached Glassnode data for key {cache_key[:8]}... (age: {age:.0f}s)")
-            return df.copy()
-        else:
-            # Expired, remove from cache
-            del _glassnode_cache[cache_key]
-            logger.debug(f"Cache expired for key {cache_key[:8]}...")
+    Returns:
+        Tuple of (entry, age in seconds) if present and fresh, None otherwise
+    """
+    try:
+        conn = _disk_cache_connect()
+        if conn is None:
+            return None
+        with conn:
+            row = conn.execute(
+                "SELECT stored_at, payload FROM glassnode_cache WHERE cache_key = ?",
+                (repr(cache_key),)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            # Wall-clock time, since entries must stay valid across restarts
+            stored_at, payload = row
+            age = time.time() - stored_at
+            if age >= CACHE_TTL:
+                conn.execute("DELETE FROM glassnode_cache WHERE cache_key = ?", (repr(cache_key),))
+                return None
+    except sqlite3.Error as e:
+        logger.warning(f"Glassnode disk cache read failed: {e}")
+        _disk_cache_disconnect()
+        return None
     
-    return None
+    try:
+        index, values, validators = pickle.loads(payload)
+    except Exception as e:
+        logger.warning(f"Discarding unreadable Glassnode disk cache entry for {cache_key}: {e}")
+        _delete_disk_cached_response(cache_key)
+        return None
+    return _CacheEntry(index, values, time.monotonic() - age, validators), age
 
 
-def _store_cached_response(cache_key: str, df: pd.DataFrame):
+def _store_disk_cached_response(cache_key: CacheKey, entry: _CacheEntry):
     """
-    Store response in cache.
+    Write a response to the persistent cache tier, if configured.
     
     Args:
         cache_key: Cache key
-        df: DataFrame to cache
+        entry: Cache entry to persist
     """
-    _glassnode_cache[cache_key] = (df.copy(), time.time())
-    logger.debug(f"Cached Glassnode data for key {cache_key[:8]}...")
+    try:
+        conn = _disk_cache_connect()
+        if conn is None:
+            return
+        payload = pickle.dumps((entry.index, entry.values, entry.validators), protocol=pickle.HIGHEST_PROTOCOL)
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO glassnode_cache (cache_key, stored_at, payload) VALUES (?, ?, ?)",
+                (repr(cache_key), time.time(), payload)
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"Glassnode disk cache write failed: {e}")
+        _disk_cache_disconnect()
+
+
+def _delete_disk_cached_response(cache_key: CacheKey):
+    """
+    Remove a response from the persistent cache tier, if configured.
+    
+    Args:
+        cache_key: Cache key
+    """
+    try:
+        conn = _disk_cache_connect()
+        if conn is None:
+            return
+        with conn:
+            conn.execute("DELETE FROM glassnode_cache WHERE cache_key = ?", (repr(cache_key),))
+    except sqlite3.Error as e:
+        logger.warning(f"Glassnode disk cache delete failed: {e}")
+        _disk_cache_disconnect()
+
+
+class _ResponseCache:
+    """
+    Thread-safe in-memory TTL cache for Glassnode responses, backed by the
+    optional persistent tier.
+    
+    Entries are kept in insertion order, so the size bound evicts the least
+    recently stored first. Entries promoted from the persistent tier keep
+    their original store time but are inserted last, so expired entries are
+    not necessarily a prefix; the expiry sweep checks every entry. Expired
+    entries that carry validators are
+    moved to a bounded stale map so the next fetch can revalidate them with a
+    conditional request. Empty responses are tracked separately in a
+    memory-only map with the shorter negative_ttl.
+    """
+    
+    def __init__(self, ttl: float = CACHE_TTL, maxsize: int = CACHE_MAXSIZE,
+                 negative_ttl: float = NEGATIVE_CACHE_TTL):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.negative_ttl = negative_ttl
+        self.entries: Dict[CacheKey, _CacheEntry] = {}
+        self.stale: Dict[CacheKey, _CacheEntry] = {}
+        self.negative: Dict[CacheKey, float] = {}  # Key -> time.monotonic() when stored
+        self.lock = threading.RLock()
+    
+    def get(self, cache_key: CacheKey) -> Optional[pd.Series]:
+        """
+        Get cached response if available and not expired.
+        
+        The in-memory tier is checked first, then the persistent tier (if
+        configured); persistent hits are promoted into memory. Expired entries
+        are removed on access. The returned Series wraps the cached arrays
+        without copying; its values are read-only, so callers must copy before
+        modifying in place.
+        
+        Args:
+            cache_key: Cache key
+            
+        Returns:
+            Cached Series if available and fresh (empty for a cached empty
+            response), None otherwise
+        """
+        with self.lock:
+            stored_at = self.negative.get(cache_key)
+            if stored_at is not None:
+                if time.monotonic() - stored_at < self.negative_ttl:
+                    logger.debug("Using cached empty Glassnode response for key %s", cache_key)
+                    return pd.Series(dtype=float)
+                del self.negative[cache_key]
+            
+            entry = self.entries.get(cache_key)
+            if entry is not None:
+                age = time.monotonic() - entry.timestamp
+                
+                if age < self.ttl:
+                    logger.debug("Using cached Glassnode data for key %s (age: %.0fs)", cache_key, age)
+                    return pd.Series(entry.values, index=entry.index, name='Value', copy=False)
+                
+                # Expired, remove from cache
+                self._expire(cache_key)
+                logger.debug("Cache expired for key %s", cache_key)
+        
+        disk_entry = _load_disk_cached_response(cache_key)
+        if disk_entry is None:
+            return None
+        
+        entry, age = disk_entry
+        with self.lock:
+            self._put(cache_key, entry)
+        logger.debug("Using disk-cached Glassnode data for key %s (age: %.0fs)", cache_key, age)
+        return pd.Series(entry.values, index=entry.index, name='Value', copy=False)
+    
+    def get_stale(self, cache_key: CacheKey) -> Optional[_CacheEntry]:
+        """
+        Get an expired entry that can be revalidated with a conditional request.
+        
+        Args:
+            cache_key: Cache key
+            
+        Returns:
+            Stale cache entry with validators, or None
+        """
+        with self.lock:
+            return self.stale.get(cache_key)
+    
+    def store(self, cache_key: CacheKey, series: pd.Series, validators: Optional[Dict[str, str]] = None):
+        """
+        Store response in cache, evicting expired and (if full) oldest entries.
+        
+        The values are copied into a private array marked read-only, so neither
+        the stored Series (e.g. the one get_metric returns on a miss) nor the
+        Series returned by later hits can modify the cache. The response is
+        also written to the persistent tier, if configured.
+        
+        Args:
+            cache_key: Cache key
+            series: Metric Series to cache
+            validators: ETag / Last-Modified headers from the response, if any
+        """
+        entry = _CacheEntry(series.index, series.to_numpy(copy=True), time.monotonic(), validators or {})
+        
+        with self.lock:
+            self._put(cache_key, entry)
+        
+        _store_disk_cached_response(cache_key, entry)
+        logger.debug("Cached Glassnode data for key %s", cache_key)
+    
+    def store_empty(self, cache_key: CacheKey):
+        """
+        Remember that a request returned no data, for negative_ttl seconds.
+        
+        Empty responses are not written to the persistent tier.
+        
+        Args:
+            cache_key: Cache key
+        """
+        with self.lock:
+            self.negative.pop(cache_key, None)
+            self.negative[cache_key] = time.monotonic()
+            
+            # Same TTL for every negative entry, so expired ones form a prefix
+            now = time.monotonic()
+            while self.negative:
+                oldest_key = next(iter(self.negative))
+                if (now - self.negative[oldest_key] < self.negative_ttl
+                        and len(self.negative) <= self.maxsize):
+                    break
+                del self.negative[oldest_key]
+        logger.debug("Cached empty Glassnode response for key %s", cache_key)
+    
+    def invalidate(self, cache_key: CacheKey):
+        """
+        Drop a key from every tier, so the next fetch goes to the API.
+        
+        Args:
+            cache_key: Cache key
+        """
+        with self.lock:
+            self.entries.pop(cache_key, None)
+            self.stale.pop(cache_key, None)
+            self.negative.pop(cache_key, None)
+        _delete_disk_cached_response(cache_key)
+    
+    def clear(self):
+        """Remove all in-memory entries, fresh, stale and empty."""
+        with self.lock:
+            self.entries.clear()
+            self.stale.clear()
+            self.negative.clear()
+    
+    def clean_expired(self):
+        """Remove all expired entries from the cache."""
+        with self.lock:
+            now = time.monotonic()
+            expired = [key for key, entry in self.entries.items() if now - entry.timestamp >= self.ttl]
+            for key in expired:
+                self._expire(key)
+            removed = len(expired)
+        if removed:
+            logger.debug("Cleaned %d expired cache entries", removed)
+    
+    def _put(self, cache_key: CacheKey, entry: _CacheEntry):
+        """Insert an entry (its values are marked read-only). Caller holds the lock."""
+        entry.values.flags.writeable = False
+        
+        # Re-insert so the entry moves to the end of the insertion order
+        self.entries.pop(cache_key, None)
+        self.stale.pop(cache_key, None)
+        self.negative.pop(cache_key, None)
+        self.entries[cache_key] = entry
+        
+        self.clean_expired()
+        while len(self.entries) > self.maxsize:
+            del self.entries[next(iter(self.entries))]
+    
+    def _expire(self, cache_key: CacheKey):
+        """Drop an expired entry, keeping it if it can be revalidated. Caller holds the lock."""
+        entry = self.entries.pop(cache_key)
+        if entry.validators:
+            self.stale[cache_key] = entry
+            while len(self.stale) > self.maxsize:
+                del self.stale[next(iter(self.stale))]
 
 
-def _clean_expired_cache():
-    """Remove expired entries from cache."""
-    now = time.time()
-    expired_keys = [
-        key for key, (_, timestamp) in _glassnode_cache.items()
-        if now - timestamp >= CACHE_TTL
-    ]
-    for key in expired_keys:
-        del _glassnode_cache[key]
-    if expired_keys:
-        logger.debug(f"Cleaned {len(expired_keys)} expired cache entries")
+def _metric_getter(name: str, endpoint: str):
+    """
+    Build the get_<name> method of GlassnodeClient for a fixed endpoint.
+    
+    The getters keep their original positional order (asset, start_date,
+    end_date, use_cache); interval and precision are keyword-only. The method
+    is named get_<name> so tracebacks, logs and help() show its public name.
+    
+    Args:
+        name: Metric name (a GlassnodeClient.METRICS key, e.g. "mvrv")
+        endpoint: Metric endpoint (e.g., "indicators/mvrv")
+        
+    Returns:
+        Method calling get_metric for the endpoint
+    """
+    def getter(
+        self,
+        asset: str = "BTC",
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        use_cache: bool = True,
+        *,
+        interval: str = "24h",
+        precision: str = "f64"
+    ) -> pd.Series:
+        return self.get_metric(endpoint, asset, start_date, end_date, interval=interval,
+                               use_cache=use_cache, precision=precision)
+    
+    getter.__name__ = f"get_{name}"
+    getter.__qualname__ = f"GlassnodeClient.get_{name}"
+    getter.__doc__ = f"Fetch the {endpoint} metric (see get_metric)."
+    return getter
 
 
 class GlassnodeClient:
     """Client for Glassnode API."""
     
+    # Metric name -> endpoint, for the get_<name> getters and bulk fetches
+    # via get_metrics(list(GlassnodeClient.METRICS.values()))
+    METRICS = {
+        'mvrv': 'indicators/mvrv',  # Market Value to Realized Value ratio
+        'nupl': 'indicators/nupl',  # Net Unrealized Profit/Loss
+        'cvdd': 'indicators/cvdd',  # Cumulative Value Days Destroyed
+        'sopr': 'indicators/sopr',  # Spent Output Profit Ratio
+        'thermocap': 'mining/thermocap',  # Cumulative Miner Revenue
+        'puell_multiple': 'indicators/puell_multiple',
+        'reserve_risk': 'indicators/reserve_risk',
+        'days_destroyed': 'transactions/days_destroyed_cumulative',  # Cumulative
+        'exchange_netflows': 'exchanges/netflows',  # Exchange Net Position Change
+    }
+    
     def __init__(self, api_key: Optional[str] = None, base_url: str = GLASSNODE_BASE_URL):
         """
         Initialize Glassnode API client.
         
+        The HTTP adapter only retries failed connection attempts, which never
+        reach the server. Gateway errors (502/503/504) and read timeouts are
+        not retried inside the adapter: those resends would bypass the rate
+        limiter, so one get_metric call could spend several requests of quota
+        while the token bucket charges one.
+        
         Args:
             api_key: Glassnode API key (defaults to GLASSNODE_API_KEY env var)
             base_url: Base URL for Glassnode API
         """
         self.api_key = api_key or GLASSNODE_API_KEY
         self.base_url = base_url
+        self.cache = _ResponseCache()
         self.session = requests.Session()
         
+        # Sent with every request; requests merges these with per-call params
+        if self.api_key:
+            self.session.params = {'api_key': self.api_key}
+        
+        # Ask for compressed JSON. urllib3 only advertises encodings it can
+        # decode (br needs brotli installed)
+        self.session.headers.update(make_headers(accept_encoding=True, keep_alive=True))
+        self.session.headers['Accept'] = 'application/json'
+        
+        # Keep enough pooled keep-alive connections for concurrent get_metrics
+        # calls, and retry failed connects with backoff (see above)
+        adapter = HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_REQUESTS,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5)
+        )
+        self.session.mount('https://', adapter)
+        
         if not self.api_key:
             logger.warning("No Glassnode API key provided. Set GLASSNODE_API_KEY environment variable.")
     
     def _make_request(
         self,
         endpoint: str,
-        params: Dict[str, Any]
+        params: Dict[str, Any],
+        validators: Optional[Dict[str, str]] = None,
+        response_validators: Optional[Dict[str, str]] = None
     ) -> Any:
         """
         Make a request to Glassnode API with rate limiting and error handling.
@@ -186,9 +652,14 @@ class GlassnodeClient:
         Args:
             endpoint: API endpoint (e.g., "/v1/metrics/indicators/mvrv")
             params: Request parameters
+            validators: ETag / Last-Modified values from a cached response;
+                sent as If-None-Match / If-Modified-Since
+            response_validators: If given, filled with the response's
+                ETag / Last-Modified headers
             
         Returns:
-            Response data (list of dicts)
+            Response data (list of dicts), or NOT_MODIFIED if the server
+            answered 304 to a conditional request
             
         Raises:
             Exception: If request fails
@@ -199,28 +670,36 @@ class GlassnodeClient:
         # Rate limiting
         _rate_limiter.wait_if_needed()
         
-        # Clean expired cache periodically
-        if len(_glassnode_cache) > 100:
-            _clean_expired_cache()
-        
-        # Add API key to params
-        params = params.copy()
-        params['api_key'] = self.api_key
-        
         url = f"{self.base_url}{endpoint}"
         
         try:
-            logger.debug(f"Glassnode API request: {endpoint} with params: {dict((k, v) for k, v in params.items() if k != 'api_key')}")
+            # The API key is merged in from session-level params
+            logger.debug("Glassnode API request: %s with params: %s", endpoint, params)
             
+            headers = {
+                VALIDATOR_HEADERS[name]: value
+                for name, value in (validators or {}).items()
+            }
             response = self.session.get(
                 url,
                 params=params,
+                headers=headers,
                 timeout=(5, 30)  # 5s connect, 30s read
             )
             
+            if response.status_code == 304:
+                logger.debug("Glassnode API %s not modified", endpoint)
+                return NOT_MODIFIED
+            
             response.raise_for_status()
             
-            data = response.json()
+            if response_validators is not None:
+                for name in VALIDATOR_HEADERS:
+                    if name in response.headers:
+                        response_validators[name] = response.headers[name]
+            
+            # orjson parses large metric arrays several times faster than stdlib json
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
             # Glassnode returns empty list if no data
             if not data:
@@ -262,7 +741,8 @@ class GlassnodeClient:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         interval: str = "24h",
-        use_cache: bool = True
+        use_cache: bool = True,
+        precision: str = "f64"
     ) -> pd.Series:
         """
         Fetch a metric from Glassnode API.
@@ -274,26 +754,37 @@ class GlassnodeClient:
             end_date: End date for data (defaults to today)
             interval: Time interval ("24h", "1h", "1w", etc.)
             use_cache: Whether to use cached data if available
+            precision: "f64" (default) keeps full float64 precision; "f32"
+                stores and returns float32 values, for bounded ratio metrics
+                (MVRV, NUPL, SOPR) only, since float32 spacing is far too coarse
+                for large cumulative series such as thermocap or CVDD
             
         Returns:
             Pandas Series with metric values indexed by date
+            
+        Raises:
+            ValueError: If precision is not "f32" or "f64"
         """
+        if precision not in PRECISION_DTYPES:
+            raise ValueError(f"Unknown precision: {precision}. Use one of {list(PRECISION_DTYPES)}")
+        
         if not self.api_key:
             logger.warning("No Glassnode API key - cannot fetch metric")
             return pd.Series(dtype=float)
         
-        # Default end date to today
+        # Default end date to the current interval bucket (today, for daily data)
+        # so repeated same-day calls share a cache key
         if end_date is None:
-            end_date = datetime.now()
+            end_date = _snap_to_interval(datetime.now(timezone.utc), interval)
         
         # Generate cache key
-        cache_key = _generate_cache_key(metric, asset, start_date, end_date, interval)
+        cache_key = _generate_cache_key(metric, asset, start_date, end_date, interval, precision)
         
         # Check cache
         if use_cache:
-            cached_df = _get_cached_response(cache_key)
-            if cached_df is not None:
-                return cached_df.iloc[:, 0] if len(cached_df.columns) > 0 else pd.Series(dtype=float)
+            cached_series = self.cache.get(cache_key)
+            if cached_series is not None:
+                return cached_series
         
         # Build endpoint
         endpoint = f"/v1/metrics/{metric}"
@@ -305,139 +796,150 @@ class GlassnodeClient:
         }
         
         if start_date:
-            params['s'] = int(start_date.timestamp())
+            params['s'] = _to_epoch(start_date, interval)
         if end_date:
-            params['u'] = int(end_date.timestamp())
+            params['u'] = _to_epoch(end_date, interval)
+        
+        # An expired entry with validators can be revalidated instead of re-downloaded
+        stale_entry = self.cache.get_stale(cache_key) if use_cache else None
         
         try:
             # Make request
-            data = self._make_request(endpoint, params)
+            response_validators: Dict[str, str] = {}
+            data = self._make_request(
+                endpoint,
+                params,
+                validators=stale_entry.validators if stale_entry else None,
+                response_validators=response_validators
+            )
+            
+            if data is NOT_MODIFIED:
+                series = pd.Series(stale_entry.values, index=stale_entry.index, name='Value', copy=False)
+                self.cache.store(cache_key, series, {**stale_entry.validators, **response_validators})
+                logger.info("✓ Revalidated cached %s from Glassnode (304 Not Modified)", metric)
+                return series
             
             if not data:
                 logger.warning(f"No data returned from Glassnode for {metric}")
+                if use_cache:
+                    self.cache.store_empty(cache_key)
                 return pd.Series(dtype=float)
             
             # Parse response
             # Glassnode returns list of dicts: [{"t": timestamp, "v": value}, ...]
-            df_data = []
-            for record in data:
-                if 't' in record and 'v' in record:
-                    timestamp = datetime.fromtimestamp(record['t'])
-                    value = record['v']
-                    df_data.append({
-                        'Date': timestamp,
-                        'Value': value
-                    })
-            
-            if not df_data:
+            try:
+                pairs = list(map(_record_fields, data))
+            except KeyError:
+                # Malformed records present: fall back to filtering them out
+                pairs = [_record_fields(record) for record in data if 't' in record and 'v' in record]
+            
+            if not pairs:
                 logger.warning(f"No valid data in Glassnode response for {metric}")
+                if use_cache:
+                    self.cache.store_empty(cache_key)
                 return pd.Series(dtype=float)
             
-            df = pd.DataFrame(df_data)
-            df.set_index('Date', inplace=True)
-            df.sort_index(inplace=True)
+            # JSON nulls become NaN in the float conversion
+            parsed = np.array(pairs, dtype=float)
+            timestamps = parsed[:, 0].astype(np.int64)
+            values = np.ascontiguousarray(parsed[:, 1], dtype=PRECISION_DTYPES[precision])
+            
+            index = pd.DatetimeIndex(pd.to_datetime(timestamps, unit='s'), name='Date')
+            series = pd.Series(values, index=index, name='Value').sort_index()
             
             # Store in cache
             if use_cache:
-                _store_cached_response(cache_key, df)
+                self.cache.store(cache_key, series, response_validators)
             
-            logger.info(f"✓ Fetched {metric} from Glassnode: {len(df)} data points from {df.index.min()} to {df.index.max()}")
+            # Index is sorted, so the endpoints are the date range
+            logger.info("✓ Fetched %s from Glassnode: %d data points from %s to %s",
+                        metric, len(series), series.index[0], series.index[-1])
             
-            return df['Value']
+            return series
             
         except Exception as e:
             logger.error(f"Error fetching {metric} from Glassnode: {e}")
             return pd.Series(dtype=float)
     
-    def get_mvrv(
-        self,
-        asset: str = "BTC",
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        use_cache: bool = True
-    ) -> pd.Series:
-        """Fetch MVRV (Market Value to Realized Value) ratio."""
-        return self.get_metric("indicators/mvrv", asset, start_date, end_date, use_cache=use_cache)
-    
-    def get_nupl(
+    def get_metrics(
         self,
+        metrics: List[str],
         asset: str = "BTC",
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        use_cache: bool = True
-    ) -> pd.Series:
-        """Fetch NUPL (Net Unrealized Profit/Loss)."""
-        return self.get_metric("indicators/nupl", asset, start_date, end_date, use_cache=use_cache)
-    
-    def get_cvdd(
-        self,
-        asset: str = "BTC",
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        use_cache: bool = True
-    ) -> pd.Series:
-        """Fetch CVDD (Cumulative Value Days Destroyed)."""
-        return self.get_metric("indicators/cvdd", asset, start_date, end_date, use_cache=use_cache)
-    
-    def get_sopr(
-        self,
-        asset: str = "BTC",
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        use_cache: bool = True
-    ) -> pd.Series:
-        """Fetch SOPR (Spent Output Profit Ratio)."""
-        return self.get_metric("indicators/sopr", asset, start_date, end_date, use_cache=use_cache)
-    
-    def get_thermocap(
-        self,
-        asset: str = "BTC",
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        use_cache: bool = True
-    ) -> pd.Series:
-        """Fetch Bitcoin Thermocap (Cumulative Miner Revenue)."""
-        return self.get_metric("mining/thermocap", asset, start_date, end_date, use_cache=use_cache)
-    
-    def get_puell_multiple(
-        self,
-        asset: str = "BTC",
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        use_cache: bool = True
-    ) -> pd.Series:
-        """Fetch Puell Multiple."""
-        return self.get_metric("indicators/puell_multiple", asset, start_date, end_date, use_cache=use_cache)
-    
-    def get_reserve_risk(
-        self,
-        asset: str = "BTC",
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        use_cache: bool = True
-    ) -> pd.Series:
-        """Fetch Reserve Risk."""
-        return self.get_metric("indicators/reserve_risk", asset, start_date, end_date, use_cache=use_cache)
+        interval: str = "24h",
+        use_cache: bool = True,
+        precision: str = "f64"
+    ) -> Dict[str, pd.Series]:
+        """
+        Fetch several metrics concurrently.
+        
+        Requests run on a thread pool sharing this client's session and the
+        global rate limiter, so the rate budget is still respected.
+        
+        Args:
+            metrics: Metric endpoints (e.g., ["indicators/mvrv", "indicators/nupl"])
+            asset: Asset symbol (default: "BTC")
+            start_date: Start date for data
+            end_date: End date for data (defaults to today)
+            interval: Time interval ("24h", "1h", "1w", etc.)
+            use_cache: Whether to use cached data if available
+            precision: Value precision ("f32" or "f64"), see get_metric
+            
+        Returns:
+            Dictionary mapping each metric to its Series, in request order
+        """
+        unique_metrics = list(dict.fromkeys(metrics))
+        if not unique_metrics:
+            return {}
+        
+        max_workers = min(MAX_CONCURRENT_REQUESTS, len(unique_metrics))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                metric: executor.submit(
+                    self.get_metric, metric, asset, start_date, end_date, interval, use_cache, precision
+                )
+                for metric in unique_metrics
+            }
+            return {metric: future.result() for metric, future in futures.items()}
     
-    def get_days_destroyed(
+    def invalidate(
         self,
+        metric: str,
         asset: str = "BTC",
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        use_cache: bool = True
-    ) -> pd.Series:
-        """Fetch Bitcoin Days Destroyed (cumulative)."""
-        return self.get_metric("transactions/days_destroyed_cumulative", asset, start_date, end_date, use_cache=use_cache)
+        interval: str = "24h",
+        precision: str = "f64"
+    ):
+        """
+        Drop the cached response for a request, including a cached empty one.
+        
+        Arguments match get_metric, so the next identical get_metric call
+        fetches from the API.
+        
+        Args:
+            metric: Metric endpoint (e.g., "indicators/mvrv")
+            asset: Asset symbol (default: "BTC")
+            start_date: Start date for data
+            end_date: End date for data (defaults to today)
+            interval: Time interval ("24h", "1h", "1w", etc.)
+            precision: Value precision ("f32" or "f64")
+        """
+        if end_date is None:
+            end_date = _snap_to_interval(datetime.now(timezone.utc), interval)
+        self.cache.invalidate(_generate_cache_key(metric, asset, start_date, end_date, interval, precision))
     
-    def get_exchange_netflows(
-        self,
-        asset: str = "BTC",
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        use_cache: bool = True
-    ) -> pd.Series:
-        """Fetch Exchange Net Position Change (netflows)."""
-        return self.get_metric("exchanges/netflows", asset, start_date, end_date, use_cache=use_cache)
+    # Named metric getters, e.g. get_mvrv(asset, start_date, end_date, use_cache)
+    get_mvrv = _metric_getter('mvrv', METRICS['mvrv'])
+    get_nupl = _metric_getter('nupl', METRICS['nupl'])
+    get_cvdd = _metric_getter('cvdd', METRICS['cvdd'])
+    get_sopr = _metric_getter('sopr', METRICS['sopr'])
+    get_thermocap = _metric_getter('thermocap', METRICS['thermocap'])
+    get_puell_multiple = _metric_getter('puell_multiple', METRICS['puell_multiple'])
+    get_reserve_risk = _metric_getter('reserve_risk', METRICS['reserve_risk'])
+    get_days_destroyed = _metric_getter('days_destroyed', METRICS['days_destroyed'])
+    get_exchange_netflows = _metric_getter('exchange_netflows', METRICS['exchange_netflows'])
     
     def test_connection(self) -> Dict[str, Any]:
         """
@@ -468,7 +970,7 @@ class GlassnodeClient:
                 result["success"] = True
                 result["endpoint"] = "/v1/metrics/indicators/mvrv"
                 result["data_points"] = len(data)
-                logger.info(f"✓ Glassnode API connection test successful")
+                logger.info("✓ Glassnode API connection test successful")
             else:
                 result["error"] = "API responded but returned no data"
                 
@@ -479,19 +981,15 @@ class GlassnodeClient:
         return result
 
 
-# Global client instance
-_glassnode_client: Optional[GlassnodeClient] = None
-
-
+@cache
 def get_glassnode_client() -> GlassnodeClient:
     """
     Get or create global Glassnode client instance.
     
+    The instance is created on first call and memoized; call
+    get_glassnode_client.cache_clear() to force a new one (e.g. in tests).
+    
     Returns:
         GlassnodeClient instance
     """
-    global _glassnode_client
-    if _glassnode_client is None:
-        _glassnode_client = GlassnodeClient()
-    return _glassnode_client
-
+    return GlassnodeClient()
@@ -7,13 +7,25 @@ metadata, parameters, and condition generation functions.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Any, Callable, Optional
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Any, Callable, Optional, Union, Iterable, FrozenSet, Mapping
 import logging
 
 logger = logging.getLogger(__name__)
+
+# pandas 3 always uses copy-on-write, so shallow copies are safe to hand back
+# to callers; older versions need a real copy to keep the input untouched
+PANDAS_COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3
+
 from .indicators import (
-    sma, ema, rsi, bollinger_bands, macd, stochastic, williams_r, atr, cci, momentum,
-    adx, parabolic_sar, ichimoku_cloud, obv, volume_sma, keltner_channels
+    sma, ema, rsi, bollinger_bands, stochastic, williams_r, atr, cci, momentum,
+    adx, parabolic_sar, ichimoku_cloud, obv, volume_sma,
+    _true_range_values
 )
 from .pinescript_indicators import (
     rsi_trail_signal, lwst_signal, ssd_signal, vtsp_signal, dema_dmi_signal,
@@ -25,26 +37,150 @@ from .pinescript_indicators import (
 )
 
 
+@dataclass(frozen=True, slots=True, eq=False)
 class IndicatorMetadata:
-    """Metadata for a technical indicator."""
-    
-    def __init__(
-        self,
-        name: str,
-        description: str,
-        parameters: Dict[str, Dict[str, Any]],
-        conditions: Dict[str, str],
-        compute_fn: Callable,
-        evaluate_conditions_fn: Callable,
-        category: str = "Other"
-    ):
-        self.name = name
-        self.description = description
-        self.parameters = parameters
-        self.conditions = conditions
-        self.compute_fn = compute_fn
-        self.evaluate_conditions_fn = evaluate_conditions_fn
-        self.category = category  # Momentum, Trend, Volatility, Other
+    """Metadata for a technical indicator.
+    
+    Instances are immutable: parameters and conditions are exposed as
+    read-only mappings. Equality and hashing are by identity, so a metadata
+    object can be used as a cache key.
+    """
+    
+    name: str
+    description: str
+    parameters: Mapping[str, Mapping[str, Any]]
+    conditions: Mapping[str, str]
+    compute_fn: Callable
+    evaluate_conditions_fn: Callable
+    category: str = "Other"  # Momentum, Trend, Volatility, Other
+    _condition_keys: Tuple[str, ...] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'parameters', MappingProxyType(dict(self.parameters)))
+        object.__setattr__(self, 'conditions', MappingProxyType(dict(self.conditions)))
+        object.__setattr__(self, '_condition_keys', tuple(self.conditions))
+
+
+# Intermediates shared by compute functions for the duration of one
+# compute_indicators call (None outside it): EMAs of Close by period for EMA,
+# EMA_Cross, MACD and Keltner, the True Range for ATR, ADX and Keltner, and
+# ATR by period for ATR and Keltner
+_shared_memo: ContextVar[Optional[Dict[Any, Any]]] = ContextVar('_shared_memo', default=None)
+
+
+def _close_ema(df: pd.DataFrame, period: int) -> pd.Series:
+    """EMA of df['Close'], reused across indicators within compute_indicators."""
+    memo = _shared_memo.get()
+    if memo is None:
+        return ema(df['Close'], period)
+    key = ('close_ema', period)
+    if key not in memo:
+        memo[key] = ema(df['Close'], period)
+    return memo[key]
+
+
+def _true_range(df: pd.DataFrame) -> np.ndarray:
+    """True Range of the High/Low/Close columns, reused within compute_indicators."""
+    memo = _shared_memo.get()
+    if memo is None:
+        return _true_range_values(df['High'], df['Low'], df['Close'])
+    if 'true_range' not in memo:
+        memo['true_range'] = _true_range_values(df['High'], df['Low'], df['Close'])
+    return memo['true_range']
+
+
+def _atr(df: pd.DataFrame, period: int) -> pd.Series:
+    """ATR of the High/Low/Close columns, reused within compute_indicators."""
+    memo = _shared_memo.get()
+    key = ('atr', period)
+    if memo is None or key not in memo:
+        atr_values = atr(df['High'], df['Low'], df['Close'], period, tr=_true_range(df))
+        if memo is None:
+            return atr_values
+        memo[key] = atr_values
+    return memo[key]
+
+
+def _shift_mask(mask: np.ndarray) -> np.ndarray:
+    """
+    Shift a boolean mask forward one row, with False in the first row.
+    
+    Equivalent to comparing .shift(1) Series (the leading NaN compares False),
+    but computed once from the current-row mask instead of re-comparing.
+    """
+    shifted = np.empty_like(mask)
+    shifted[:1] = False
+    shifted[1:] = mask[:-1]
+    return shifted
+
+
+def _previous(values: np.ndarray) -> np.ndarray:
+    """Previous-row values of a float array, NaN in the first row (like .shift(1))."""
+    shifted = np.empty_like(values)
+    shifted[:1] = np.nan
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing rolling mean, matching Series.rolling(window).mean().
+    
+    Uses a running (cumulative) sum so each output is one subtraction instead
+    of a window-length reduction. Windows containing NaN, and the first
+    window - 1 rows, are NaN.
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) < window:
+        return out
+    
+    missing = np.isnan(values)
+    running_sum = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, values))))
+    running_missing = np.concatenate(([0], np.cumsum(missing)))
+    
+    window_sum = running_sum[window:] - running_sum[:-window]
+    has_missing = (running_missing[window:] - running_missing[:-window]) > 0
+    out[window - 1:] = np.where(has_missing, np.nan, window_sum / window)
+    return out
+
+
+# Set by evaluate_all_conditions_packed so evaluators return their raw masks
+# rather than wrapping each one in a Series that would only be unwrapped again
+_raw_condition_masks: ContextVar[bool] = ContextVar('_raw_condition_masks', default=False)
+
+# Condition names requested from evaluate_all_conditions (None = all); the
+# others are dropped before being wrapped
+_condition_filter: ContextVar[Optional[FrozenSet[str]]] = ContextVar('_condition_filter', default=None)
+
+
+def _condition_series(index: pd.Index, masks: Dict[str, np.ndarray]) -> Dict[str, pd.Series]:
+    """Wrap boolean condition arrays as Series on the DataFrame index (raw arrays when packing)."""
+    wanted = _condition_filter.get()
+    if wanted is not None:
+        masks = {name: mask for name, mask in masks.items() if name in wanted}
+    if _raw_condition_masks.get():
+        return masks
+    return {name: pd.Series(mask, index=index, copy=False) for name, mask in masks.items()}
+
+
+def _ensure_indicator(df: pd.DataFrame, indicator_id: str, params: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Add a registry indicator's columns for an evaluator that found them missing.
+    
+    Goes through compute_indicators, so lazily computed columns are served from
+    and stored in the indicator cache, and the caller's DataFrame is not modified.
+    """
+    return compute_indicators(df, [{'id': indicator_id, 'params': params}])
+
+
+def _signal_conditions(df: pd.DataFrame, signal_col: str, prefix: str) -> Dict[str, pd.Series]:
+    """Long/short/bullish conditions from a PineScript +1/-1 signal column."""
+    signal = df[signal_col].to_numpy()
+    return _condition_series(df.index, {
+        f'{prefix}_long': signal == 1,
+        f'{prefix}_short': signal == -1,
+        f'{prefix}_bullish': signal > 0
+    })
 
 
 def compute_rsi_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -63,14 +199,18 @@ def evaluate_rsi_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[st
     
     rsi_col = f'RSI_{period}'
     if rsi_col not in df.columns:
-        df = compute_rsi_indicator(df, params)
+        df = _ensure_indicator(df, 'RSI', params)
     
-    return {
-        'rsi_oversold': df[rsi_col] < oversold,
-        'rsi_overbought': df[rsi_col] > overbought,
-        'rsi_cross_above_oversold': (df[rsi_col] > oversold) & (df[rsi_col].shift(1) <= oversold),
-        'rsi_cross_below_overbought': (df[rsi_col] < overbought) & (df[rsi_col].shift(1) >= overbought)
-    }
+    rsi_values = df[rsi_col].to_numpy(dtype=float)
+    at_or_below_oversold = rsi_values <= oversold
+    at_or_above_overbought = rsi_values >= overbought
+    
+    return _condition_series(df.index, {
+        'rsi_oversold': rsi_values < oversold,
+        'rsi_overbought': rsi_values > overbought,
+        'rsi_cross_above_oversold': (rsi_values > oversold) & _shift_mask(at_or_below_oversold),
+        'rsi_cross_below_overbought': (rsi_values < overbought) & _shift_mask(at_or_above_overbought)
+    })
 
 
 def compute_macd_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -79,7 +219,11 @@ def compute_macd_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataF
     slow = params.get('slow', 26)
     signal = params.get('signal', 9)
     
-    macd_line, signal_line, histogram = macd(df['Close'], fast, slow, signal)
+    # Same arithmetic as macd(), but the fast/slow EMAs may be shared with
+    # EMA / EMA_Cross indicators computed in the same batch
+    macd_line = _close_ema(df, fast) - _close_ema(df, slow)
+    signal_line = ema(macd_line, signal)
+    histogram = macd_line - signal_line
     df[f'MACD_{fast}_{slow}'] = macd_line
     df[f'MACD_Signal_{signal}'] = signal_line
     df[f'MACD_Histogram_{fast}_{slow}_{signal}'] = histogram
@@ -96,16 +240,21 @@ def evaluate_macd_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[s
     signal_col = f'MACD_Signal_{signal}'
     
     if macd_col not in df.columns:
-        df = compute_macd_indicator(df, params)
+        df = _ensure_indicator(df, 'MACD', params)
+    
+    macd_values = df[macd_col].to_numpy(dtype=float)
+    signal_values = df[signal_col].to_numpy(dtype=float)
+    above = macd_values > signal_values
+    below = macd_values < signal_values
     
-    return {
-        'macd_cross_up': (df[macd_col] > df[signal_col]) & (df[macd_col].shift(1) <= df[signal_col].shift(1)),
-        'macd_cross_down': (df[macd_col] < df[signal_col]) & (df[macd_col].shift(1) >= df[signal_col].shift(1)),
-        'macd_above_signal': df[macd_col] > df[signal_col],
-        'macd_below_signal': df[macd_col] < df[signal_col],
-        'macd_above_zero': df[macd_col] > 0,
-        'macd_below_zero': df[macd_col] < 0
-    }
+    return _condition_series(df.index, {
+        'macd_cross_up': above & _shift_mask(macd_values <= signal_values),
+        'macd_cross_down': below & _shift_mask(macd_values >= signal_values),
+        'macd_above_signal': above,
+        'macd_below_signal': below,
+        'macd_above_zero': macd_values > 0,
+        'macd_below_zero': macd_values < 0
+    })
 
 
 def compute_sma_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -122,20 +271,25 @@ def evaluate_sma_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[st
     sma_col = f'SMA_{period}'
     
     if sma_col not in df.columns:
-        df = compute_sma_indicator(df, params)
+        df = _ensure_indicator(df, 'SMA', params)
+    
+    close = df['Close'].to_numpy(dtype=float)
+    sma_values = df[sma_col].to_numpy(dtype=float)
+    above = close > sma_values
+    below = close < sma_values
     
-    return {
-        'sma_price_above': df['Close'] > df[sma_col],
-        'sma_price_below': df['Close'] < df[sma_col],
-        'sma_price_cross_above': (df['Close'] > df[sma_col]) & (df['Close'].shift(1) <= df[sma_col].shift(1)),
-        'sma_price_cross_below': (df['Close'] < df[sma_col]) & (df['Close'].shift(1) >= df[sma_col].shift(1))
-    }
+    return _condition_series(df.index, {
+        'sma_price_above': above,
+        'sma_price_below': below,
+        'sma_price_cross_above': above & _shift_mask(close <= sma_values),
+        'sma_price_cross_below': below & _shift_mask(close >= sma_values)
+    })
 
 
 def compute_ema_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
     """Compute EMA indicator and add to DataFrame."""
     period = params.get('period', 20)
-    ema_values = ema(df['Close'], period)
+    ema_values = _close_ema(df, period)
     df[f'EMA_{period}'] = ema_values
     return df
 
@@ -146,14 +300,19 @@ def evaluate_ema_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[st
     ema_col = f'EMA_{period}'
     
     if ema_col not in df.columns:
-        df = compute_ema_indicator(df, params)
+        df = _ensure_indicator(df, 'EMA', params)
     
-    return {
-        'ema_price_above': df['Close'] > df[ema_col],
-        'ema_price_below': df['Close'] < df[ema_col],
-        'ema_price_cross_above': (df['Close'] > df[ema_col]) & (df['Close'].shift(1) <= df[ema_col].shift(1)),
-        'ema_price_cross_below': (df['Close'] < df[ema_col]) & (df['Close'].shift(1) >= df[ema_col].shift(1))
-    }
+    close = df['Close'].to_numpy(dtype=float)
+    ema_values = df[ema_col].to_numpy(dtype=float)
+    above = close > ema_values
+    below = close < ema_values
+    
+    return _condition_series(df.index, {
+        'ema_price_above': above,
+        'ema_price_below': below,
+        'ema_price_cross_above': above & _shift_mask(close <= ema_values),
+        'ema_price_cross_below': below & _shift_mask(close >= ema_values)
+    })
 
 
 def compute_bollinger_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -177,15 +336,21 @@ def evaluate_bollinger_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> D
     lower_col = f'BB_Lower_{window}_{num_std}'
     
     if upper_col not in df.columns:
-        df = compute_bollinger_indicator(df, params)
+        df = _ensure_indicator(df, 'Bollinger', params)
+    
+    close = df['Close'].to_numpy(dtype=float)
+    upper = df[upper_col].to_numpy(dtype=float)
+    lower = df[lower_col].to_numpy(dtype=float)
+    squeeze_width = _rolling_mean(upper, 20)
+    squeeze_width *= 0.5  # Scale in place rather than allocating a scaled copy
     
-    return {
-        'bb_price_above_upper': df['Close'] > df[upper_col],
-        'bb_price_below_lower': df['Close'] < df[lower_col],
-        'bb_price_touch_upper': (df['Close'] >= df[upper_col]) & (df['Close'].shift(1) < df[upper_col].shift(1)),
-        'bb_price_touch_lower': (df['Close'] <= df[lower_col]) & (df['Close'].shift(1) > df[lower_col].shift(1)),
-        'bb_price_squeeze': (df[upper_col] - df[lower_col]) < (df[upper_col].rolling(20).mean() * 0.5)
-    }
+    return _condition_series(df.index, {
+        'bb_price_above_upper': close > upper,
+        'bb_price_below_lower': close < lower,
+        'bb_price_touch_upper': (close >= upper) & _shift_mask(close < upper),
+        'bb_price_touch_lower': (close <= lower) & _shift_mask(close > lower),
+        'bb_price_squeeze': (upper - lower) < squeeze_width
+    })
 
 
 def compute_ema_cross_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -193,8 +358,8 @@ def compute_ema_cross_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.
     fast_period = params.get('fast_period', 12)
     slow_period = params.get('slow_period', 26)
     
-    fast_ema = ema(df['Close'], fast_period)
-    slow_ema = ema(df['Close'], slow_period)
+    fast_ema = _close_ema(df, fast_period)
+    slow_ema = _close_ema(df, slow_period)
     
     df[f'EMA_Fast_{fast_period}'] = fast_ema
     df[f'EMA_Slow_{slow_period}'] = slow_ema
@@ -210,14 +375,19 @@ def evaluate_ema_cross_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> D
     slow_col = f'EMA_Slow_{slow_period}'
     
     if fast_col not in df.columns:
-        df = compute_ema_cross_indicator(df, params)
+        df = _ensure_indicator(df, 'EMA_Cross', params)
+    
+    fast = df[fast_col].to_numpy(dtype=float)
+    slow = df[slow_col].to_numpy(dtype=float)
+    fast_above = fast > slow
+    slow_above = slow > fast
     
-    return {
-        'ema_fast_gt_slow': df[fast_col] > df[slow_col],
-        'ema_slow_gt_fast': df[slow_col] > df[fast_col],
-        'ema_cross_up': (df[fast_col] > df[slow_col]) & (df[fast_col].shift(1) <= df[slow_col].shift(1)),
-        'ema_cross_down': (df[fast_col] < df[slow_col]) & (df[fast_col].shift(1) >= df[slow_col].shift(1))
-    }
+    return _condition_series(df.index, {
+        'ema_fast_gt_slow': fast_above,
+        'ema_slow_gt_fast': slow_above,
+        'ema_cross_up': fast_above & _shift_mask(fast <= slow),
+        'ema_cross_down': slow_above & _shift_mask(fast >= slow)
+    })
 
 
 def compute_stochastic_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -242,16 +412,21 @@ def evaluate_stochastic_conditions(df: pd.DataFrame, params: Dict[str, Any]) ->
     d_col = f'Stoch_D_{d_period}'
     
     if k_col not in df.columns:
-        df = compute_stochastic_indicator(df, params)
+        df = _ensure_indicator(df, 'Stochastic', params)
     
-    return {
-        'stoch_oversold': df[k_col] < oversold,
-        'stoch_overbought': df[k_col] > overbought,
-        'stoch_k_cross_above_d': (df[k_col] > df[d_col]) & (df[k_col].shift(1) <= df[d_col].shift(1)),
-        'stoch_k_cross_below_d': (df[k_col] < df[d_col]) & (df[k_col].shift(1) >= df[d_col].shift(1)),
-        'stoch_k_above_d': df[k_col] > df[d_col],
-        'stoch_k_below_d': df[k_col] < df[d_col]
-    }
+    k_values = df[k_col].to_numpy(dtype=float)
+    d_values = df[d_col].to_numpy(dtype=float)
+    k_above_d = k_values > d_values
+    k_below_d = k_values < d_values
+    
+    return _condition_series(df.index, {
+        'stoch_oversold': k_values < oversold,
+        'stoch_overbought': k_values > overbought,
+        'stoch_k_cross_above_d': k_above_d & _shift_mask(k_values <= d_values),
+        'stoch_k_cross_below_d': k_below_d & _shift_mask(k_values >= d_values),
+        'stoch_k_above_d': k_above_d,
+        'stoch_k_below_d': k_below_d
+    })
 
 
 def compute_williams_r_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -271,14 +446,16 @@ def evaluate_williams_r_conditions(df: pd.DataFrame, params: Dict[str, Any]) ->
     wr_col = f'Williams_R_{period}'
     
     if wr_col not in df.columns:
-        df = compute_williams_r_indicator(df, params)
+        df = _ensure_indicator(df, 'Williams_R', params)
+    
+    wr_values = df[wr_col].to_numpy(dtype=float)
     
-    return {
-        'williams_r_oversold': df[wr_col] < oversold,
-        'williams_r_overbought': df[wr_col] > overbought,
-        'williams_r_cross_above_oversold': (df[wr_col] > oversold) & (df[wr_col].shift(1) <= oversold),
-        'williams_r_cross_below_overbought': (df[wr_col] < overbought) & (df[wr_col].shift(1) >= overbought)
-    }
+    return _condition_series(df.index, {
+        'williams_r_oversold': wr_values < oversold,
+        'williams_r_overbought': wr_values > overbought,
+        'williams_r_cross_above_oversold': (wr_values > oversold) & _shift_mask(wr_values <= oversold),
+        'williams_r_cross_below_overbought': (wr_values < overbought) & _shift_mask(wr_values >= overbought)
+    })
 
 
 def compute_cci_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -298,16 +475,18 @@ def evaluate_cci_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[st
     cci_col = f'CCI_{period}'
     
     if cci_col not in df.columns:
-        df = compute_cci_indicator(df, params)
+        df = _ensure_indicator(df, 'CCI', params)
+    
+    cci_values = df[cci_col].to_numpy(dtype=float)
     
-    return {
-        'cci_oversold': df[cci_col] < oversold,
-        'cci_overbought': df[cci_col] > overbought,
-        'cci_cross_above_oversold': (df[cci_col] > oversold) & (df[cci_col].shift(1) <= oversold),
-        'cci_cross_below_overbought': (df[cci_col] < overbought) & (df[cci_col].shift(1) >= overbought),
-        'cci_above_zero': df[cci_col] > 0,
-        'cci_below_zero': df[cci_col] < 0
-    }
+    return _condition_series(df.index, {
+        'cci_oversold': cci_values < oversold,
+        'cci_overbought': cci_values > overbought,
+        'cci_cross_above_oversold': (cci_values > oversold) & _shift_mask(cci_values <= oversold),
+        'cci_cross_below_overbought': (cci_values < overbought) & _shift_mask(cci_values >= overbought),
+        'cci_above_zero': cci_values > 0,
+        'cci_below_zero': cci_values < 0
+    })
 
 
 def compute_momentum_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -326,14 +505,18 @@ def evaluate_momentum_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Di
     momentum_col = f'Momentum_{period}'
     
     if momentum_col not in df.columns:
-        df = compute_momentum_indicator(df, params)
+        df = _ensure_indicator(df, 'Momentum', params)
     
-    return {
-        'momentum_positive': df[momentum_col] > threshold,
-        'momentum_negative': df[momentum_col] < threshold,
-        'momentum_cross_above_zero': (df[momentum_col] > threshold) & (df[momentum_col].shift(1) <= threshold),
-        'momentum_cross_below_zero': (df[momentum_col] < threshold) & (df[momentum_col].shift(1) >= threshold)
-    }
+    momentum_values = df[momentum_col].to_numpy(dtype=float)
+    positive = momentum_values > threshold
+    negative = momentum_values < threshold
+    
+    return _condition_series(df.index, {
+        'momentum_positive': positive,
+        'momentum_negative': negative,
+        'momentum_cross_above_zero': positive & _shift_mask(momentum_values <= threshold),
+        'momentum_cross_below_zero': negative & _shift_mask(momentum_values >= threshold)
+    })
 
 
 # Trend Indicators
@@ -341,7 +524,7 @@ def evaluate_momentum_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Di
 def compute_adx_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
     """Compute ADX indicator and add to DataFrame."""
     period = params.get('period', 14)
-    adx_values = adx(df['High'], df['Low'], df['Close'], period)
+    adx_values = adx(df['High'], df['Low'], df['Close'], period, tr=_true_range(df))
     df[f'ADX_{period}'] = adx_values
     return df
 
@@ -354,14 +537,18 @@ def evaluate_adx_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[st
     adx_col = f'ADX_{period}'
     
     if adx_col not in df.columns:
-        df = compute_adx_indicator(df, params)
+        df = _ensure_indicator(df, 'ADX', params)
+    
+    adx_values = df[adx_col].to_numpy(dtype=float)
+    strong = adx_values > strong_trend
+    weak = adx_values < strong_trend
     
-    return {
-        'adx_strong_trend': df[adx_col] > strong_trend,
-        'adx_weak_trend': df[adx_col] < strong_trend,
-        'adx_cross_above_strong': (df[adx_col] > strong_trend) & (df[adx_col].shift(1) <= strong_trend),
-        'adx_cross_below_strong': (df[adx_col] < strong_trend) & (df[adx_col].shift(1) >= strong_trend)
-    }
+    return _condition_series(df.index, {
+        'adx_strong_trend': strong,
+        'adx_weak_trend': weak,
+        'adx_cross_above_strong': strong & _shift_mask(adx_values <= strong_trend),
+        'adx_cross_below_strong': weak & _shift_mask(adx_values >= strong_trend)
+    })
 
 
 def compute_parabolic_sar_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -378,14 +565,19 @@ def compute_parabolic_sar_indicator(df: pd.DataFrame, params: Dict[str, Any]) ->
 def evaluate_parabolic_sar_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate Parabolic SAR conditions and return boolean series."""
     if 'Parabolic_SAR' not in df.columns:
-        df = compute_parabolic_sar_indicator(df, params)
+        df = _ensure_indicator(df, 'Parabolic_SAR', params)
+    
+    close = df['Close'].to_numpy(dtype=float)
+    sar = df['Parabolic_SAR'].to_numpy(dtype=float)
+    above = close > sar
+    below = close < sar
     
-    return {
-        'psar_price_above': df['Close'] > df['Parabolic_SAR'],
-        'psar_price_below': df['Close'] < df['Parabolic_SAR'],
-        'psar_price_cross_above': (df['Close'] > df['Parabolic_SAR']) & (df['Close'].shift(1) <= df['Parabolic_SAR'].shift(1)),
-        'psar_price_cross_below': (df['Close'] < df['Parabolic_SAR']) & (df['Close'].shift(1) >= df['Parabolic_SAR'].shift(1))
-    }
+    return _condition_series(df.index, {
+        'psar_price_above': above,
+        'psar_price_below': below,
+        'psar_price_cross_above': above & _shift_mask(close <= sar),
+        'psar_price_cross_below': below & _shift_mask(close >= sar)
+    })
 
 
 def compute_ichimoku_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -420,18 +612,27 @@ def evaluate_ichimoku_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Di
     senkou_b_col = f'Ichimoku_Senkou_B_{senkou_b}'
     
     if tenkan_col not in df.columns:
-        df = compute_ichimoku_indicator(df, params)
-    
-    return {
-        'ichimoku_price_above_cloud': df['Close'] > df[[senkou_a_col, senkou_b_col]].max(axis=1),
-        'ichimoku_price_below_cloud': df['Close'] < df[[senkou_a_col, senkou_b_col]].min(axis=1),
-        'ichimoku_tenkan_above_kijun': df[tenkan_col] > df[kijun_col],
-        'ichimoku_tenkan_below_kijun': df[tenkan_col] < df[kijun_col],
-        'ichimoku_tenkan_cross_above_kijun': (df[tenkan_col] > df[kijun_col]) & (df[tenkan_col].shift(1) <= df[kijun_col].shift(1)),
-        'ichimoku_tenkan_cross_below_kijun': (df[tenkan_col] < df[kijun_col]) & (df[tenkan_col].shift(1) >= df[kijun_col].shift(1)),
-        'ichimoku_cloud_bullish': df[senkou_a_col] > df[senkou_b_col],
-        'ichimoku_cloud_bearish': df[senkou_a_col] < df[senkou_b_col]
-    }
+        df = _ensure_indicator(df, 'Ichimoku', params)
+    
+    close = df['Close'].to_numpy(dtype=float)
+    tenkan_values = df[tenkan_col].to_numpy(dtype=float)
+    kijun_values = df[kijun_col].to_numpy(dtype=float)
+    senkou_a_values = df[senkou_a_col].to_numpy(dtype=float)
+    senkou_b_values = df[senkou_b_col].to_numpy(dtype=float)
+    tenkan_above = tenkan_values > kijun_values
+    tenkan_below = tenkan_values < kijun_values
+    
+    # fmax/fmin skip a NaN span like DataFrame.max/min(axis=1)
+    return _condition_series(df.index, {
+        'ichimoku_price_above_cloud': close > np.fmax(senkou_a_values, senkou_b_values),
+        'ichimoku_price_below_cloud': close < np.fmin(senkou_a_values, senkou_b_values),
+        'ichimoku_tenkan_above_kijun': tenkan_above,
+        'ichimoku_tenkan_below_kijun': tenkan_below,
+        'ichimoku_tenkan_cross_above_kijun': tenkan_above & _shift_mask(tenkan_values <= kijun_values),
+        'ichimoku_tenkan_cross_below_kijun': tenkan_below & _shift_mask(tenkan_values >= kijun_values),
+        'ichimoku_cloud_bullish': senkou_a_values > senkou_b_values,
+        'ichimoku_cloud_bearish': senkou_a_values < senkou_b_values
+    })
 
 
 # Volume Indicators
@@ -449,19 +650,23 @@ def compute_obv_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFr
 def evaluate_obv_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate OBV conditions and return boolean series."""
     if 'OBV' not in df.columns:
-        df = compute_obv_indicator(df, params)
+        df = _ensure_indicator(df, 'OBV', params)
     
     obv_sma_period = params.get('obv_sma_period', 20)
-    obv_sma = sma(df['OBV'], obv_sma_period)
-    
-    return {
-        'obv_above_sma': df['OBV'] > obv_sma,
-        'obv_below_sma': df['OBV'] < obv_sma,
-        'obv_cross_above_sma': (df['OBV'] > obv_sma) & (df['OBV'].shift(1) <= obv_sma.shift(1)),
-        'obv_cross_below_sma': (df['OBV'] < obv_sma) & (df['OBV'].shift(1) >= obv_sma.shift(1)),
-        'obv_rising': df['OBV'] > df['OBV'].shift(1),
-        'obv_falling': df['OBV'] < df['OBV'].shift(1)
-    }
+    obv_values = df['OBV'].to_numpy(dtype=float)
+    obv_sma = sma(df['OBV'], obv_sma_period).to_numpy(dtype=float)
+    previous_obv = _previous(obv_values)
+    above = obv_values > obv_sma
+    below = obv_values < obv_sma
+    
+    return _condition_series(df.index, {
+        'obv_above_sma': above,
+        'obv_below_sma': below,
+        'obv_cross_above_sma': above & _shift_mask(obv_values <= obv_sma),
+        'obv_cross_below_sma': below & _shift_mask(obv_values >= obv_sma),
+        'obv_rising': obv_values > previous_obv,
+        'obv_falling': obv_values < previous_obv
+    })
 
 
 def compute_volume_sma_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -486,15 +691,20 @@ def evaluate_volume_sma_conditions(df: pd.DataFrame, params: Dict[str, Any]) ->
     volume_sma_col = f'Volume_SMA_{period}'
     
     if volume_sma_col not in df.columns:
-        df = compute_volume_sma_indicator(df, params)
+        df = _ensure_indicator(df, 'Volume_SMA', params)
+    
+    volume = df['Volume'].to_numpy(dtype=float)
+    volume_sma_values = df[volume_sma_col].to_numpy(dtype=float)
+    above = volume > volume_sma_values
+    below = volume < volume_sma_values
     
-    return {
-        'volume_above_sma': df['Volume'] > df[volume_sma_col],
-        'volume_below_sma': df['Volume'] < df[volume_sma_col],
-        'volume_spike': df['Volume'] > (df[volume_sma_col] * multiplier),
-        'volume_cross_above_sma': (df['Volume'] > df[volume_sma_col]) & (df['Volume'].shift(1) <= df[volume_sma_col].shift(1)),
-        'volume_cross_below_sma': (df['Volume'] < df[volume_sma_col]) & (df['Volume'].shift(1) >= df[volume_sma_col].shift(1))
-    }
+    return _condition_series(df.index, {
+        'volume_above_sma': above,
+        'volume_below_sma': below,
+        'volume_spike': volume > (volume_sma_values * multiplier),
+        'volume_cross_above_sma': above & _shift_mask(volume <= volume_sma_values),
+        'volume_cross_below_sma': below & _shift_mask(volume >= volume_sma_values)
+    })
 
 
 # Volatility Indicators
@@ -502,8 +712,7 @@ def evaluate_volume_sma_conditions(df: pd.DataFrame, params: Dict[str, Any]) ->
 def compute_atr_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
     """Compute ATR indicator and add to DataFrame."""
     period = params.get('period', 14)
-    atr_values = atr(df['High'], df['Low'], df['Close'], period)
-    df[f'ATR_{period}'] = atr_values
+    df[f'ATR_{period}'] = _atr(df, period)
     return df
 
 
@@ -516,24 +725,31 @@ def evaluate_atr_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[st
     atr_col = f'ATR_{period}'
     
     if atr_col not in df.columns:
-        df = compute_atr_indicator(df, params)
+        df = _ensure_indicator(df, 'ATR', params)
+    
+    atr_values = df[atr_col].to_numpy(dtype=float)
+    previous_atr = _previous(atr_values)
     
     # Use ATR SMA for thresholds if not provided
-    if high_threshold is None:
-        atr_sma = sma(df[atr_col], 20)
-        high_threshold = atr_sma * 1.5
-    if low_threshold is None:
-        atr_sma = sma(df[atr_col], 20)
-        low_threshold = atr_sma * 0.5
-    
-    return {
-        'atr_high_volatility': df[atr_col] > high_threshold,
-        'atr_low_volatility': df[atr_col] < low_threshold,
-        'atr_cross_above_high': (df[atr_col] > high_threshold) & (df[atr_col].shift(1) <= high_threshold),
-        'atr_cross_below_low': (df[atr_col] < low_threshold) & (df[atr_col].shift(1) >= low_threshold),
-        'atr_rising': df[atr_col] > df[atr_col].shift(1),
-        'atr_falling': df[atr_col] < df[atr_col].shift(1)
-    }
+    if high_threshold is None or low_threshold is None:
+        atr_sma = _rolling_mean(atr_values, 20)
+        if high_threshold is None:
+            high_threshold = atr_sma * 1.5
+        if low_threshold is None:
+            low_threshold = atr_sma * 0.5
+    
+    # The previous ATR is compared against the current row's threshold
+    high_volatility = atr_values > high_threshold
+    low_volatility = atr_values < low_threshold
+    
+    return _condition_series(df.index, {
+        'atr_high_volatility': high_volatility,
+        'atr_low_volatility': low_volatility,
+        'atr_cross_above_high': high_volatility & (previous_atr <= high_threshold),
+        'atr_cross_below_low': low_volatility & (previous_atr >= low_threshold),
+        'atr_rising': atr_values > previous_atr,
+        'atr_falling': atr_values < previous_atr
+    })
 
 
 def compute_keltner_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -541,7 +757,12 @@ def compute_keltner_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.Da
     period = params.get('period', 20)
     multiplier = params.get('multiplier', 2.0)
     
-    upper, middle, lower = keltner_channels(df['High'], df['Low'], df['Close'], period, multiplier)
+    # Same arithmetic as keltner_channels(), but the EMA and ATR may be shared
+    # with EMA / MACD / ATR indicators computed in the same batch
+    middle = _close_ema(df, period)
+    atr_values = _atr(df, period)
+    upper = middle + (multiplier * atr_values)
+    lower = middle - (multiplier * atr_values)
     df[f'KC_Upper_{period}_{multiplier}'] = upper
     df[f'KC_Middle_{period}'] = middle
     df[f'KC_Lower_{period}_{multiplier}'] = lower
@@ -557,15 +778,21 @@ def evaluate_keltner_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dic
     lower_col = f'KC_Lower_{period}_{multiplier}'
     
     if upper_col not in df.columns:
-        df = compute_keltner_indicator(df, params)
+        df = _ensure_indicator(df, 'Keltner', params)
+    
+    close = df['Close'].to_numpy(dtype=float)
+    upper = df[upper_col].to_numpy(dtype=float)
+    lower = df[lower_col].to_numpy(dtype=float)
+    squeeze_width = _rolling_mean(upper, 20)
+    squeeze_width *= 0.5
     
-    return {
-        'kc_price_above_upper': df['Close'] > df[upper_col],
-        'kc_price_below_lower': df['Close'] < df[lower_col],
-        'kc_price_touch_upper': (df['Close'] >= df[upper_col]) & (df['Close'].shift(1) < df[upper_col].shift(1)),
-        'kc_price_touch_lower': (df['Close'] <= df[lower_col]) & (df['Close'].shift(1) > df[lower_col].shift(1)),
-        'kc_squeeze': (df[upper_col] - df[lower_col]) < (df[upper_col].rolling(20).mean() * 0.5)
-    }
+    return _condition_series(df.index, {
+        'kc_price_above_upper': close > upper,
+        'kc_price_below_lower': close < lower,
+        'kc_price_touch_upper': (close >= upper) & _shift_mask(close < upper),
+        'kc_price_touch_lower': (close <= lower) & _shift_mask(close > lower),
+        'kc_squeeze': (upper - lower) < squeeze_width
+    })
 
 
 # PineScript Indicator Compute Functions
@@ -582,12 +809,8 @@ def compute_rsitrail_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.D
 def evaluate_rsitrail_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate RSI Trail conditions."""
     if 'RSITrail_Signal' not in df.columns:
-        df = compute_rsitrail_indicator(df, params)
-    return {
-        'rsitrail_long': df['RSITrail_Signal'] == 1,
-        'rsitrail_short': df['RSITrail_Signal'] == -1,
-        'rsitrail_bullish': df['RSITrail_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'RSITrail', params)
+    return _signal_conditions(df, 'RSITrail_Signal', 'rsitrail')
 
 
 def compute_lwst_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -605,12 +828,8 @@ def compute_lwst_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataF
 def evaluate_lwst_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate LWST conditions."""
     if 'LWST_Signal' not in df.columns:
-        df = compute_lwst_indicator(df, params)
-    return {
-        'lwst_long': df['LWST_Signal'] == 1,
-        'lwst_short': df['LWST_Signal'] == -1,
-        'lwst_bullish': df['LWST_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'LWST', params)
+    return _signal_conditions(df, 'LWST_Signal', 'lwst')
 
 
 def compute_ssd_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -630,12 +849,8 @@ def compute_ssd_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFr
 def evaluate_ssd_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate SSD conditions."""
     if 'SSD_Signal' not in df.columns:
-        df = compute_ssd_indicator(df, params)
-    return {
-        'ssd_long': df['SSD_Signal'] == 1,
-        'ssd_short': df['SSD_Signal'] == -1,
-        'ssd_bullish': df['SSD_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'SSD', params)
+    return _signal_conditions(df, 'SSD_Signal', 'ssd')
 
 
 def compute_vtsp_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -650,12 +865,8 @@ def compute_vtsp_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataF
 def evaluate_vtsp_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate VTSP conditions."""
     if 'VTSP_Signal' not in df.columns:
-        df = compute_vtsp_indicator(df, params)
-    return {
-        'vtsp_long': df['VTSP_Signal'] == 1,
-        'vtsp_short': df['VTSP_Signal'] == -1,
-        'vtsp_bullish': df['VTSP_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'VTSP', params)
+    return _signal_conditions(df, 'VTSP_Signal', 'vtsp')
 
 
 def compute_demadmi_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -671,12 +882,8 @@ def compute_demadmi_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.Da
 def evaluate_demadmi_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate DemaDMI conditions."""
     if 'DemaDMI_Signal' not in df.columns:
-        df = compute_demadmi_indicator(df, params)
-    return {
-        'demadmi_long': df['DemaDMI_Signal'] == 1,
-        'demadmi_short': df['DemaDMI_Signal'] == -1,
-        'demadmi_bullish': df['DemaDMI_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'DemaDMI', params)
+    return _signal_conditions(df, 'DemaDMI_Signal', 'demadmi')
 
 
 def compute_ewma_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -691,12 +898,8 @@ def compute_ewma_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataF
 def evaluate_ewma_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate EWMA conditions."""
     if 'EWMA_Signal' not in df.columns:
-        df = compute_ewma_indicator(df, params)
-    return {
-        'ewma_long': df['EWMA_Signal'] == 1,
-        'ewma_short': df['EWMA_Signal'] == -1,
-        'ewma_bullish': df['EWMA_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'EWMA', params)
+    return _signal_conditions(df, 'EWMA_Signal', 'ewma')
 
 
 def compute_emazscore_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -715,11 +918,7 @@ def evaluate_emazscore_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> D
     """Evaluate EmaZScore conditions."""
     if 'EmaZScore_Signal' not in df.columns:
         df = compute_emazscore_indicator(df, params)
-    return {
-        'emazscore_long': df['EmaZScore_Signal'] == 1,
-        'emazscore_short': df['EmaZScore_Signal'] == -1,
-        'emazscore_bullish': df['EmaZScore_Signal'] > 0
-    }
+    return _signal_conditions(df, 'EmaZScore_Signal', 'emazscore')
 
 
 def compute_dst_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -736,12 +935,8 @@ def compute_dst_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFr
 def evaluate_dst_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate DST conditions."""
     if 'DST_Signal' not in df.columns:
-        df = compute_dst_indicator(df, params)
-    return {
-        'dst_long': df['DST_Signal'] == 1,
-        'dst_short': df['DST_Signal'] == -1,
-        'dst_bullish': df['DST_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'DST', params)
+    return _signal_conditions(df, 'DST_Signal', 'dst')
 
 
 def compute_msd_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -759,12 +954,8 @@ def compute_msd_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFr
 def evaluate_msd_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate MSD conditions."""
     if 'MSD_Signal' not in df.columns:
-        df = compute_msd_indicator(df, params)
-    return {
-        'msd_long': df['MSD_Signal'] == 1,
-        'msd_short': df['MSD_Signal'] == -1,
-        'msd_bullish': df['MSD_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'MSD', params)
+    return _signal_conditions(df, 'MSD_Signal', 'msd')
 
 
 def compute_demaefi_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -780,12 +971,8 @@ def compute_demaefi_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.Da
 def evaluate_demaefi_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate DemaEFI conditions."""
     if 'DemaEFI_Signal' not in df.columns:
-        df = compute_demaefi_indicator(df, params)
-    return {
-        'demaefi_long': df['DemaEFI_Signal'] == 1,
-        'demaefi_short': df['DemaEFI_Signal'] == -1,
-        'demaefi_bullish': df['DemaEFI_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'DemaEFI', params)
+    return _signal_conditions(df, 'DemaEFI_Signal', 'demaefi')
 
 
 def compute_hsp_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -800,12 +987,8 @@ def compute_hsp_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFr
 def evaluate_hsp_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate HSP conditions."""
     if 'HSP_Signal' not in df.columns:
-        df = compute_hsp_indicator(df, params)
-    return {
-        'hsp_long': df['HSP_Signal'] == 1,
-        'hsp_short': df['HSP_Signal'] == -1,
-        'hsp_bullish': df['HSP_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'HSP', params)
+    return _signal_conditions(df, 'HSP_Signal', 'hsp')
 
 
 def compute_demaafr_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -822,12 +1005,8 @@ def compute_demaafr_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.Da
 def evaluate_demaafr_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate DemaAFR conditions."""
     if 'DemaAFR_Signal' not in df.columns:
-        df = compute_demaafr_indicator(df, params)
-    return {
-        'demaafr_long': df['DemaAFR_Signal'] == 1,
-        'demaafr_short': df['DemaAFR_Signal'] == -1,
-        'demaafr_bullish': df['DemaAFR_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'DemaAFR', params)
+    return _signal_conditions(df, 'DemaAFR_Signal', 'demaafr')
 
 
 def compute_rsisd_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -843,12 +1022,8 @@ def compute_rsisd_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.Data
 def evaluate_rsisd_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate RSIsd conditions."""
     if 'RSIsd_Signal' not in df.columns:
-        df = compute_rsisd_indicator(df, params)
-    return {
-        'rsisd_long': df['RSIsd_Signal'] == 1,
-        'rsisd_short': df['RSIsd_Signal'] == -1,
-        'rsisd_bullish': df['RSIsd_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'RSIsd', params)
+    return _signal_conditions(df, 'RSIsd_Signal', 'rsisd')
 
 
 def compute_inverted_sd_dema_rsi_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -866,12 +1041,8 @@ def compute_inverted_sd_dema_rsi_indicator(df: pd.DataFrame, params: Dict[str, A
 def evaluate_inverted_sd_dema_rsi_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate Inverted_SD_Dema_RSI conditions."""
     if 'Inverted_SD_Dema_RSI_Signal' not in df.columns:
-        df = compute_inverted_sd_dema_rsi_indicator(df, params)
-    return {
-        'inverted_sd_dema_rsi_long': df['Inverted_SD_Dema_RSI_Signal'] == 1,
-        'inverted_sd_dema_rsi_short': df['Inverted_SD_Dema_RSI_Signal'] == -1,
-        'inverted_sd_dema_rsi_bullish': df['Inverted_SD_Dema_RSI_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'Inverted_SD_Dema_RSI', params)
+    return _signal_conditions(df, 'Inverted_SD_Dema_RSI_Signal', 'inverted_sd_dema_rsi')
 
 
 # New Indicator Compute Functions
@@ -888,12 +1059,8 @@ def compute_kvo_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFr
 def evaluate_kvo_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate KVO conditions."""
     if 'KVO_Signal' not in df.columns:
-        df = compute_kvo_indicator(df, params)
-    return {
-        'kvo_long': df['KVO_Signal'] == 1,
-        'kvo_short': df['KVO_Signal'] == -1,
-        'kvo_bullish': df['KVO_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'KVO', params)
+    return _signal_conditions(df, 'KVO_Signal', 'kvo')
 
 
 def compute_stc_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -909,12 +1076,8 @@ def compute_stc_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFr
 def evaluate_stc_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate STC conditions."""
     if 'STC_Signal' not in df.columns:
-        df = compute_stc_indicator(df, params)
-    return {
-        'stc_long': df['STC_Signal'] == 1,
-        'stc_short': df['STC_Signal'] == -1,
-        'stc_bullish': df['STC_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'STC', params)
+    return _signal_conditions(df, 'STC_Signal', 'stc')
 
 
 def compute_eri_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -928,12 +1091,8 @@ def compute_eri_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFr
 def evaluate_eri_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate ERI conditions."""
     if 'ERI_Signal' not in df.columns:
-        df = compute_eri_indicator(df, params)
-    return {
-        'eri_long': df['ERI_Signal'] == 1,
-        'eri_short': df['ERI_Signal'] == -1,
-        'eri_bullish': df['ERI_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'ERI', params)
+    return _signal_conditions(df, 'ERI_Signal', 'eri')
 
 
 def compute_cmo_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -947,12 +1106,8 @@ def compute_cmo_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFr
 def evaluate_cmo_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate CMO conditions."""
     if 'CMO_Signal' not in df.columns:
-        df = compute_cmo_indicator(df, params)
-    return {
-        'cmo_long': df['CMO_Signal'] == 1,
-        'cmo_short': df['CMO_Signal'] == -1,
-        'cmo_bullish': df['CMO_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'CMO', params)
+    return _signal_conditions(df, 'CMO_Signal', 'cmo')
 
 
 def compute_fisher_transform_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -966,12 +1121,8 @@ def compute_fisher_transform_indicator(df: pd.DataFrame, params: Dict[str, Any])
 def evaluate_fisher_transform_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate Fisher Transform conditions."""
     if 'FisherTransform_Signal' not in df.columns:
-        df = compute_fisher_transform_indicator(df, params)
-    return {
-        'fisher_transform_long': df['FisherTransform_Signal'] == 1,
-        'fisher_transform_short': df['FisherTransform_Signal'] == -1,
-        'fisher_transform_bullish': df['FisherTransform_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'FisherTransform', params)
+    return _signal_conditions(df, 'FisherTransform_Signal', 'fisher_transform')
 
 
 def compute_bb_percent_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -988,11 +1139,7 @@ def evaluate_bb_percent_conditions(df: pd.DataFrame, params: Dict[str, Any]) ->
     """Evaluate BB Percent conditions."""
     if 'BBPercent_Signal' not in df.columns:
         df = compute_bb_percent_indicator(df, params)
-    return {
-        'bb_percent_long': df['BBPercent_Signal'] == 1,
-        'bb_percent_short': df['BBPercent_Signal'] == -1,
-        'bb_percent_bullish': df['BBPercent_Signal'] > 0
-    }
+    return _signal_conditions(df, 'BBPercent_Signal', 'bb_percent')
 
 
 def compute_tsi_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -1009,11 +1156,7 @@ def evaluate_tsi_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[st
     """Evaluate TSI conditions."""
     if 'TSI_Signal' not in df.columns:
         df = compute_tsi_indicator(df, params)
-    return {
-        'tsi_long': df['TSI_Signal'] == 1,
-        'tsi_short': df['TSI_Signal'] == -1,
-        'tsi_bullish': df['TSI_Signal'] > 0
-    }
+    return _signal_conditions(df, 'TSI_Signal', 'tsi')
 
 
 def compute_disparity_index_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -1028,12 +1171,8 @@ def compute_disparity_index_indicator(df: pd.DataFrame, params: Dict[str, Any])
 def evaluate_disparity_index_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict[str, pd.Series]:
     """Evaluate Disparity Index conditions."""
     if 'DisparityIndex_Signal' not in df.columns:
-        df = compute_disparity_index_indicator(df, params)
-    return {
-        'disparity_index_long': df['DisparityIndex_Signal'] == 1,
-        'disparity_index_short': df['DisparityIndex_Signal'] == -1,
-        'disparity_index_bullish': df['DisparityIndex_Signal'] > 0
-    }
+        df = _ensure_indicator(df, 'DisparityIndex', params)
+    return _signal_conditions(df, 'DisparityIndex_Signal', 'disparity_index')
 
 
 def compute_chande_momentum_oscillator_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -1048,11 +1187,7 @@ def evaluate_chande_momentum_oscillator_conditions(df: pd.DataFrame, params: Dic
     """Evaluate Chande Momentum Oscillator conditions."""
     if 'ChandeMO_Signal' not in df.columns:
         df = compute_chande_momentum_oscillator_indicator(df, params)
-    return {
-        'chande_mo_long': df['ChandeMO_Signal'] == 1,
-        'chande_mo_short': df['ChandeMO_Signal'] == -1,
-        'chande_mo_bullish': df['ChandeMO_Signal'] > 0
-    }
+    return _signal_conditions(df, 'ChandeMO_Signal', 'chande_mo')
 
 
 def compute_rapr_1_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -1068,11 +1203,7 @@ def evaluate_rapr_1_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict
     """Evaluate RAPR 1 conditions."""
     if 'RAPR1_Signal' not in df.columns:
         df = compute_rapr_1_indicator(df, params)
-    return {
-        'rapr_1_long': df['RAPR1_Signal'] == 1,
-        'rapr_1_short': df['RAPR1_Signal'] == -1,
-        'rapr_1_bullish': df['RAPR1_Signal'] > 0
-    }
+    return _signal_conditions(df, 'RAPR1_Signal', 'rapr_1')
 
 
 def compute_rapr_2_indicator(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
@@ -1088,11 +1219,7 @@ def evaluate_rapr_2_conditions(df: pd.DataFrame, params: Dict[str, Any]) -> Dict
     """Evaluate RAPR 2 conditions."""
     if 'RAPR2_Signal' not in df.columns:
         df = compute_rapr_2_indicator(df, params)
-    return {
-        'rapr_2_long': df['RAPR2_Signal'] == 1,
-        'rapr_2_short': df['RAPR2_Signal'] == -1,
-        'rapr_2_bullish': df['RAPR2_Signal'] > 0
-    }
+    return _signal_conditions(df, 'RAPR2_Signal', 'rapr_2')
 
 
 # Registry of available indicators
@@ -1778,61 +1905,329 @@ INDICATOR_REGISTRY: Dict[str, IndicatorMetadata] = {
 }
 
 
-def get_indicator_metadata(indicator_id: str) -> IndicatorMetadata:
-    """Get metadata for a specific indicator."""
-    if indicator_id not in INDICATOR_REGISTRY:
+class IndicatorID(IntEnum):
+    """Integer IDs for registry indicators, in INDICATOR_REGISTRY order."""
+    RSI = 0
+    MACD = 1
+    SMA = 2
+    EMA = 3
+    BOLLINGER = 4
+    EMA_CROSS = 5
+    STOCHASTIC = 6
+    WILLIAMS_R = 7
+    CCI = 8
+    MOMENTUM = 9
+    ADX = 10
+    PARABOLIC_SAR = 11
+    ICHIMOKU = 12
+    OBV = 13
+    VOLUME_SMA = 14
+    ATR = 15
+    KELTNER = 16
+    RSITRAIL = 17
+    LWST = 18
+    SSD = 19
+    VTSP = 20
+    DEMADMI = 21
+    EWMA = 22
+    DST = 23
+    MSD = 24
+    DEMAEFI = 25
+    HSP = 26
+    DEMAAFR = 27
+    RSISD = 28
+    INVERTED_SD_DEMA_RSI = 29
+    KVO = 30
+    STC = 31
+    ERI = 32
+    CMO = 33
+    FISHERTRANSFORM = 34
+    DISPARITYINDEX = 35
+
+
+# Registry keys and metadata indexed by IndicatorID for callers in tight loops
+_INDICATOR_NAMES = tuple(INDICATOR_REGISTRY)
+_INDICATOR_METADATA = tuple(INDICATOR_REGISTRY.values())
+_INDICATOR_REGISTRY_VIEW = MappingProxyType(INDICATOR_REGISTRY)
+
+
+def _lookup_indicator(indicator_id: Union[str, IndicatorID]) -> Tuple[Optional[str], Optional[IndicatorMetadata]]:
+    """Resolve a registry key or IndicatorID to (registry key, metadata), or (None, None)."""
+    if isinstance(indicator_id, IndicatorID):
+        return _INDICATOR_NAMES[indicator_id], _INDICATOR_METADATA[indicator_id]
+    
+    metadata = INDICATOR_REGISTRY.get(indicator_id)
+    if metadata is None:
+        return None, None
+    return indicator_id, metadata
+
+
+def get_indicator_metadata(indicator_id: Union[str, IndicatorID]) -> IndicatorMetadata:
+    """Get metadata for a specific indicator by registry key or IndicatorID."""
+    _, metadata = _lookup_indicator(indicator_id)
+    if metadata is None:
         raise ValueError(f"Unknown indicator: {indicator_id}")
-    return INDICATOR_REGISTRY[indicator_id]
+    return metadata
+
 
+def get_all_indicators() -> Mapping[str, IndicatorMetadata]:
+    """Get all available indicators as a read-only view of the registry."""
+    return _INDICATOR_REGISTRY_VIEW
 
-def get_all_indicators() -> Dict[str, IndicatorMetadata]:
-    """Get all available indicators."""
-    return INDICATOR_REGISTRY.copy()
+
+@lru_cache(maxsize=128)
+def _available_conditions(indicator_ids: Tuple) -> Tuple[str, ...]:
+    """Sorted union of condition names for a tuple of indicator ids."""
+    conditions = set()
+    for indicator_id in indicator_ids:
+        _, metadata = _lookup_indicator(indicator_id)
+        if metadata is not None:
+            conditions.update(metadata._condition_keys)
+    return tuple(sorted(conditions))
 
 
 def get_available_conditions(indicators: List[Dict[str, Any]]) -> List[str]:
     """Get all available condition names for a list of indicators."""
-    conditions = []
-    for indicator_config in indicators:
-        indicator_id = indicator_config['id']
-        if indicator_id in INDICATOR_REGISTRY:
-            metadata = INDICATOR_REGISTRY[indicator_id]
-            conditions.extend(metadata.conditions.keys())
-    return sorted(list(set(conditions)))
+    return list(_available_conditions(tuple(config['id'] for config in indicators)))
+
+
+# Computed indicator columns, keyed by (input fingerprint, indicator_id, params)
+# so repeated compute_indicators calls on the same data skip the TA math
+INDICATOR_CACHE_MAXSIZE = 256
+_INDICATOR_CACHE: Dict[Tuple, Dict[str, np.ndarray]] = {}
+_indicator_cache_lock = threading.Lock()
+
+
+def _array_digest(values: np.ndarray) -> int:
+    """Hash an array's contents (object arrays are hashed element-wise by value)."""
+    values = np.asarray(values)
+    if values.dtype == object:
+        values = pd.util.hash_array(values)
+    return hash(np.ascontiguousarray(values).tobytes())
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> int:
+    """
+    Hash a DataFrame's index, column names and values.
+    
+    One pass over the raw buffers, far cheaper than any indicator computation,
+    so cache hits are only served for identical input data.
+    """
+    parts = [hash(tuple(df.columns)), _array_digest(df.index.values)]
+    parts.extend(_array_digest(df[col].to_numpy()) for col in df.columns)
+    return hash(tuple(parts))
+
+
+def _indicator_cache_key(fingerprint: int, indicator_id: str, params: Dict[str, Any]) -> Optional[Tuple]:
+    """
+    Build a cache key, or None if the params are not hashable.
+    
+    Each value's type is part of the key: 2 and 2.0 hash equal but name
+    different columns (e.g. BB_Upper_20_2 vs BB_Upper_20_2.0).
+    """
+    try:
+        key = (fingerprint, indicator_id,
+               tuple(sorted((name, type(value), value) for name, value in params.items())))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def clear_indicator_cache():
+    """Drop all cached indicator columns."""
+    with _indicator_cache_lock:
+        _INDICATOR_CACHE.clear()
+
+
+def _written_columns(before: pd.DataFrame, after: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Columns a compute_fn added to (or overwrote in) a shallow copy of before.
+    
+    Untouched input columns still share their buffers with the input, so an
+    O(1) memory-bounds check is enough to tell them apart.
+    """
+    written = {}
+    for col in after.columns:
+        values = after[col].to_numpy()
+        if col not in before.columns or not np.may_share_memory(values, before[col].to_numpy()):
+            written[col] = values
+    return written
 
 
 def compute_indicators(df: pd.DataFrame, indicators: List[Dict[str, Any]]) -> pd.DataFrame:
-    """Compute all indicators and add to DataFrame."""
-    result_df = df.copy()
+    """
+    Compute all indicators and add to DataFrame.
+    
+    Each compute_fn runs on a shallow copy of the input and only the columns it
+    writes are collected; all of them are then added in a single concat rather
+    than one DataFrame insert per column. The input's own columns are never
+    deep-copied under copy-on-write; compute_fns only add or replace columns,
+    never write into existing ones.
+    
+    Columns produced for an (indicator_id, params) pair are cached against a
+    fingerprint of the input data; later calls with the same data copy them in
+    instead of recomputing. Duplicate configs in the list are computed once,
+    EMAs of Close are shared between EMA, EMA_Cross, MACD and Keltner configs,
+    and the True Range and ATR between ATR, ADX and Keltner configs.
+    
+    A config's 'id' may be a registry key or an IndicatorID; unknown keys are
+    skipped.
+    """
+    fingerprint = _frame_fingerprint(df)
+    seen = set()
+    output_columns: Dict[str, np.ndarray] = {}
+    shared: Dict[Any, Any] = {}
     
     for indicator_config in indicators:
-        indicator_id = indicator_config['id']
+        indicator_id, metadata = _lookup_indicator(indicator_config['id'])
         params = indicator_config['params']
         
-        if indicator_id in INDICATOR_REGISTRY:
-            metadata = INDICATOR_REGISTRY[indicator_id]
-            result_df = metadata.compute_fn(result_df, params)
+        if metadata is None:
+            continue
+        
+        key = _indicator_cache_key(fingerprint, indicator_id, params)
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            with _indicator_cache_lock:
+                cached_columns = _INDICATOR_CACHE.get(key)
+            if cached_columns is not None:
+                output_columns.update(cached_columns)
+                continue
+        
+        memo_token = _shared_memo.set(shared)
+        try:
+            work_df = metadata.compute_fn(df.copy(deep=False), params)
+        finally:
+            _shared_memo.reset(memo_token)
+        written = _written_columns(df, work_df)
+        output_columns.update(written)
+        
+        if key is not None:
+            new_columns = {}
+            for col, values in written.items():
+                values = values.copy()
+                values.flags.writeable = False  # Assignment copies; never mutate the cache
+                new_columns[col] = values
+            with _indicator_cache_lock:
+                _INDICATOR_CACHE[key] = new_columns
+                while len(_INDICATOR_CACHE) > INDICATOR_CACHE_MAXSIZE:
+                    del _INDICATOR_CACHE[next(iter(_INDICATOR_CACHE))]
+    
+    added = {col: values for col, values in output_columns.items() if col not in df.columns}
+    if added:
+        result_df = pd.concat([df, pd.DataFrame(added, index=df.index)], axis=1)
+    else:
+        result_df = df.copy(deep=not PANDAS_COPY_ON_WRITE)
+    
+    # Rare: an indicator recomputed a column the input already had
+    for col, values in output_columns.items():
+        if col not in added:
+            result_df[col] = values
     
     return result_df
 
 
-def evaluate_all_conditions(df: pd.DataFrame, indicators: List[Dict[str, Any]]) -> Dict[str, pd.Series]:
-    """Evaluate all conditions for a list of indicators."""
-    all_conditions = {}
+def evaluate_all_conditions(df: pd.DataFrame, indicators: List[Dict[str, Any]],
+                            condition_names: Optional[Iterable[str]] = None) -> Dict[str, pd.Series]:
+    """
+    Evaluate all conditions for a list of indicators (ids as keys or IndicatorIDs).
     
-    for indicator_config in indicators:
-        indicator_id = indicator_config['id']
-        params = indicator_config['params']
+    Args:
+        df: DataFrame with OHLCV data (and, ideally, precomputed indicator columns)
+        indicators: Indicator configs with 'id' and 'params'
+        condition_names: If given, only these conditions are returned, and the
+            others are never wrapped in Series
         
-        if indicator_id in INDICATOR_REGISTRY:
-            metadata = INDICATOR_REGISTRY[indicator_id]
-            conditions = metadata.evaluate_conditions_fn(df, params)
-            all_conditions.update(conditions)
-        # Custom indicators feature removed during aggressive cleanup.
+    Returns:
+        Dict of condition name to boolean Series
+    """
+    wanted = None if condition_names is None else frozenset(condition_names)
+    all_conditions = {}
     
+    token = _condition_filter.set(wanted)
+    try:
+        for indicator_config in indicators:
+            _, metadata = _lookup_indicator(indicator_config['id'])
+            params = indicator_config['params']
+            
+            if metadata is not None:
+                conditions = metadata.evaluate_conditions_fn(df, params)
+                all_conditions.update(conditions)
+            # Custom indicators feature removed during aggressive cleanup.
+    finally:
+        _condition_filter.reset(token)
+    
+    if wanted is not None:
+        all_conditions = {name: cond for name, cond in all_conditions.items() if name in wanted}
     return all_conditions
 
 
+def evaluate_all_conditions_packed(df: pd.DataFrame, indicators: List[Dict[str, Any]],
+                                   condition_names: Optional[Iterable[str]] = None) -> Tuple[np.ndarray, List[str]]:
+    """
+    Evaluate all conditions into one boolean matrix instead of a dict of Series.
+    
+    Args:
+        df: DataFrame with OHLCV data (and, ideally, precomputed indicator columns)
+        indicators: Indicator configs, as for evaluate_all_conditions
+        condition_names: If given, only these conditions are packed
+        
+    Returns:
+        Tuple of a (len(df), n_conditions) bool array and the condition names
+        for its columns, in evaluate_all_conditions order. Conditions can be
+        combined row-wise with e.g. packed[:, [i, j]].all(axis=1).
+    """
+    token = _raw_condition_masks.set(True)
+    try:
+        all_conditions = evaluate_all_conditions(df, indicators, condition_names)
+    finally:
+        _raw_condition_masks.reset(token)
+    
+    packed = np.empty((len(df), len(all_conditions)), dtype=bool)
+    for col, mask in enumerate(all_conditions.values()):
+        packed[:, col] = mask
+    return packed, list(all_conditions)
+
+
+def pack_condition_bits(packed: np.ndarray) -> np.ndarray:
+    """
+    Bit-pack a condition matrix into 64-row words per condition.
+    
+    Args:
+        packed: (n_rows, n_conditions) bool array from evaluate_all_conditions_packed
+        
+    Returns:
+        (n_conditions, ceil(n_rows / 64)) uint64 array; bit k of word w is row
+        64 * w + k. Conditions combine with np.bitwise_and/np.bitwise_or on
+        whole words, and unpack_condition_bits recovers the per-row mask.
+    """
+    n_rows, n_conditions = packed.shape
+    n_words = -(-n_rows // 64)
+    bits = np.zeros((n_conditions, n_words * 8), dtype=np.uint8)
+    bits[:, :-(-n_rows // 8)] = np.packbits(packed.T, axis=1, bitorder='little')
+    return bits.view('<u8')
+
+
+def unpack_condition_bits(bits: np.ndarray, n_rows: int) -> np.ndarray:
+    """
+    Inverse of pack_condition_bits for one or more conditions.
+    
+    Args:
+        bits: uint64 words, shape (n_words,) or (n_conditions, n_words)
+        n_rows: Number of rows that were packed
+        
+    Returns:
+        bool array of shape (n_rows,) or (n_rows, n_conditions)
+    """
+    unpacked = np.unpackbits(np.ascontiguousarray(bits, dtype='<u8').view(np.uint8), axis=-1,
+                             count=n_rows, bitorder='little')
+    return unpacked.astype(bool).T
+
+
 def load_custom_indicator_from_db(indicator_id: str, db_session) -> Optional[IndicatorMetadata]:
     """
     Custom indicator loading removed during aggressive cleanup.
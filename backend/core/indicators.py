@@ -7,6 +7,7 @@ used in trading strategies, including moving averages, RSI, and others.
 
 import pandas as pd
 import numpy as np
+from scipy.signal import lfilter
 from typing import Union, Optional, Dict
 
 
@@ -24,6 +25,53 @@ def sma(data: pd.Series, window: int) -> pd.Series:
     return data.rolling(window=window).mean()
 
 
+def _ewm_values(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponentially weighted mean with adjust=False, i.e. the recursion
+    y[i] = alpha * x[i] + (1 - alpha) * y[i-1] seeded with y[0] = x[0].
+    
+    Runs the recursion as a first-order IIR filter (scipy.signal.lfilter) on
+    the raw array, skipping pandas' ewm machinery. Leading NaNs (e.g. from
+    diff()) stay NaN and the recursion starts at the first valid value; arrays
+    with NaN after that fall back to pandas, which carries the previous value
+    across missing rows.
+    
+    Args:
+        values (np.ndarray): Input data (float64)
+        alpha (float): Smoothing factor
+        
+    Returns:
+        np.ndarray: Same values as Series(values).ewm(alpha=alpha, adjust=False).mean()
+    """
+    if len(values) == 0:
+        return np.empty(0)
+    
+    missing = np.isnan(values)
+    start = int(missing.argmin())  # First valid value
+    if missing[start:].any():
+        return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    
+    smoothed = np.full(len(values), np.nan)
+    smoothed[start:], _ = lfilter([alpha], [1.0, alpha - 1.0], values[start:],
+                                  zi=[(1.0 - alpha) * values[start]])
+    return smoothed
+
+
+def _ewm_recursive(data: pd.Series, alpha: float) -> pd.Series:
+    """
+    Series wrapper around _ewm_values.
+    
+    Args:
+        data (pd.Series): Input data
+        alpha (float): Smoothing factor
+        
+    Returns:
+        pd.Series: Same values as data.ewm(alpha=alpha, adjust=False).mean()
+    """
+    smoothed = _ewm_values(data.to_numpy(dtype=np.float64), alpha)
+    return pd.Series(smoothed, index=data.index, name=data.name)
+
+
 def ema(data: pd.Series, window: int, alpha: Optional[float] = None) -> pd.Series:
     """
     Calculate Exponential Moving Average (EMA).
@@ -39,7 +87,7 @@ def ema(data: pd.Series, window: int, alpha: Optional[float] = None) -> pd.Serie
     if alpha is None:
         alpha = 2.0 / (window + 1)
     
-    return data.ewm(alpha=alpha, adjust=False).mean()
+    return _ewm_recursive(data, alpha)
 
 
 def rsi(data: pd.Series, period: int = 14) -> pd.Series:
@@ -53,22 +101,31 @@ def rsi(data: pd.Series, period: int = 14) -> pd.Series:
     Returns:
         pd.Series: RSI values (0-100)
     """
-    # Calculate price changes
-    delta = data.diff()
+    values = data.to_numpy(dtype=np.float64)
+    if len(values) == 0:
+        return pd.Series(dtype=np.float64, index=data.index, name=data.name)
+    
+    # Calculate price changes (first change is undefined, as with diff())
+    delta = np.empty_like(values)
+    delta[0] = np.nan
+    np.subtract(values[1:], values[:-1], out=delta[1:])
     
-    # Separate gains and losses
-    gains = delta.where(delta > 0, 0)
-    losses = -delta.where(delta < 0, 0)
+    # Separate gains and losses; undefined changes count as neither
+    gains_losses = np.zeros((2, len(values)))
+    np.copyto(gains_losses[0], delta, where=delta > 0)
+    np.negative(delta, out=gains_losses[1], where=delta < 0)
     
-    # Calculate average gains and losses using EMA
-    avg_gains = gains.ewm(alpha=1/period, adjust=False).mean()
-    avg_losses = losses.ewm(alpha=1/period, adjust=False).mean()
+    # Wilder smoothing of gains and losses in one filter pass (EMA, alpha = 1/period)
+    alpha = 1 / period
+    avg_gains, avg_losses = lfilter([alpha], [1.0, alpha - 1.0], gains_losses, axis=1,
+                                    zi=(1.0 - alpha) * gains_losses[:, :1])[0]
     
     # Calculate RS and RSI
-    rs = avg_gains / avg_losses
-    rsi = 100 - (100 / (1 + rs))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gains / avg_losses
+        rsi = 100 - (100 / (1 + rs))
     
-    return rsi
+    return pd.Series(rsi, index=data.index, name=data.name)
 
 
 def bollinger_bands(data: pd.Series, window: int = 20, num_std: float = 2) -> tuple:
@@ -105,12 +162,16 @@ def macd(data: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> tu
     Returns:
         tuple: (macd_line, signal_line, histogram)
     """
-    ema_fast = ema(data, fast)
-    ema_slow = ema(data, slow)
+    # All three EMAs and both differences run on raw arrays; Series are built
+    # once at the end
+    values = data.to_numpy(dtype=np.float64)
+    macd_values = _ewm_values(values, 2.0 / (fast + 1)) - _ewm_values(values, 2.0 / (slow + 1))
+    signal_values = _ewm_values(macd_values, 2.0 / (signal + 1))
+    histogram_values = macd_values - signal_values
     
-    macd_line = ema_fast - ema_slow
-    signal_line = ema(macd_line, signal)
-    histogram = macd_line - signal_line
+    macd_line = pd.Series(macd_values, index=data.index, name=data.name)
+    signal_line = pd.Series(signal_values, index=data.index, name=data.name)
+    histogram = pd.Series(histogram_values, index=data.index, name=data.name)
     
     return macd_line, signal_line, histogram
 
@@ -160,7 +221,33 @@ def williams_r(high: pd.Series, low: pd.Series, close: pd.Series, period: int =
     return williams_r
 
 
-def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
+def _true_range_values(high: pd.Series, low: pd.Series, close: pd.Series) -> np.ndarray:
+    """
+    True Range on raw arrays.
+    
+    np.fmax skips a NaN term like DataFrame.max(axis=1), so the first row
+    (no previous close) is high - low.
+    
+    Args:
+        high (pd.Series): High prices
+        low (pd.Series): Low prices
+        close (pd.Series): Close prices
+        
+    Returns:
+        np.ndarray: True Range values
+    """
+    high_values = high.to_numpy(dtype=np.float64)
+    low_values = low.to_numpy(dtype=np.float64)
+    prev_close = np.empty(len(close))
+    prev_close[:1] = np.nan
+    prev_close[1:] = close.to_numpy(dtype=np.float64)[:-1]
+    
+    tr = np.fmax(high_values - low_values, np.abs(high_values - prev_close))
+    return np.fmax(tr, np.abs(low_values - prev_close))
+
+
+def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14,
+        tr: Optional[np.ndarray] = None) -> pd.Series:
     """
     Calculate Average True Range (ATR).
     
@@ -169,22 +256,16 @@ def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) ->
         low (pd.Series): Low prices
         close (pd.Series): Close prices
         period (int): ATR period
+        tr (np.ndarray, optional): Precomputed True Range of the same prices
         
     Returns:
         pd.Series: ATR values
     """
-    # Calculate True Range components
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
-    
-    # True Range is the maximum of the three
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    # True Range is the maximum of the three range components
+    true_range = _true_range_values(high, low, close) if tr is None else tr
     
     # ATR is the EMA of True Range
-    atr = ema(true_range, period)
-    
-    return atr
+    return pd.Series(_ewm_values(true_range, 2.0 / (period + 1)), index=close.index)
 
 
 def atr_from_df(df: pd.DataFrame, period: int = 14) -> pd.Series:
@@ -245,7 +326,8 @@ def momentum(close: pd.Series, period: int = 10) -> pd.Series:
     return close.diff(period)
 
 
-def adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
+def adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14,
+        tr: Optional[np.ndarray] = None) -> pd.Series:
     """
     Calculate Average Directional Index (ADX).
     
@@ -254,41 +336,42 @@ def adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) ->
         low (pd.Series): Low prices
         close (pd.Series): Close prices
         period (int): ADX period (default: 14)
+        tr (np.ndarray, optional): Precomputed True Range of the same prices
         
     Returns:
         pd.Series: ADX values (0-100)
     """
     # Calculate True Range
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    if tr is None:
+        tr = _true_range_values(high, low, close)
     
-    # Calculate Directional Movement
-    plus_dm = high.diff()
-    minus_dm = -low.diff()
+    # Calculate Directional Movement (first row undefined, as with diff())
+    high_values = high.to_numpy(dtype=np.float64)
+    low_values = low.to_numpy(dtype=np.float64)
+    plus_dm = np.full(len(high_values), np.nan)
+    minus_dm = np.full(len(low_values), np.nan)
+    np.subtract(high_values[1:], high_values[:-1], out=plus_dm[1:])
+    np.subtract(low_values[:-1], low_values[1:], out=minus_dm[1:])
     
     plus_dm[plus_dm < 0] = 0
     minus_dm[minus_dm < 0] = 0
     
     # When both move in same direction, set the smaller to zero
-    both_directions = (plus_dm > minus_dm) & (minus_dm > 0)
-    minus_dm[both_directions] = 0
-    both_directions = (minus_dm > plus_dm) & (plus_dm > 0)
-    plus_dm[both_directions] = 0
+    minus_dm[(plus_dm > minus_dm) & (minus_dm > 0)] = 0
+    plus_dm[(minus_dm > plus_dm) & (plus_dm > 0)] = 0
     
     # Smooth the values using Wilder's smoothing (EMA-like)
-    atr_smoothed = tr.ewm(alpha=1/period, adjust=False).mean()
-    plus_di = 100 * (plus_dm.ewm(alpha=1/period, adjust=False).mean() / atr_smoothed)
-    minus_di = 100 * (minus_dm.ewm(alpha=1/period, adjust=False).mean() / atr_smoothed)
-    
-    # Calculate DX
-    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+    alpha = 1 / period
+    with np.errstate(divide='ignore', invalid='ignore'):
+        atr_smoothed = _ewm_values(tr, alpha)
+        plus_di = 100 * (_ewm_values(plus_dm, alpha) / atr_smoothed)
+        minus_di = 100 * (_ewm_values(minus_dm, alpha) / atr_smoothed)
+        
+        # Calculate DX
+        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
     
     # Calculate ADX (smoothed DX)
-    adx = dx.ewm(alpha=1/period, adjust=False).mean()
-    
-    return adx
+    return pd.Series(_ewm_values(dx, alpha), index=close.index)
 
 
 def parabolic_sar(high: pd.Series, low: pd.Series, close: pd.Series, 
@@ -308,61 +391,55 @@ def parabolic_sar(high: pd.Series, low: pd.Series, close: pd.Series,
     Returns:
         pd.Series: Parabolic SAR values
     """
-    sar = pd.Series(index=close.index, dtype=float)
-    trend = pd.Series(index=close.index, dtype=int)  # 1 = uptrend, -1 = downtrend
-    af = pd.Series(index=close.index, dtype=float)
-    ep = pd.Series(index=close.index, dtype=float)  # Extreme point
+    n = len(close)
+    sar = np.empty(n)
+    if n == 0:
+        return pd.Series(sar, index=close.index)
+    
+    # The recursion is inherently sequential; run it on plain Python floats
+    # rather than indexing Series element by element
+    highs = high.to_numpy(dtype=np.float64).tolist()
+    lows = low.to_numpy(dtype=np.float64).tolist()
     
     # Initialize
-    sar.iloc[0] = low.iloc[0]
-    trend.iloc[0] = 1
-    af.iloc[0] = af_start
-    ep.iloc[0] = high.iloc[0]
-    
-    for i in range(1, len(close)):
-        prev_sar = sar.iloc[i-1]
-        prev_trend = trend.iloc[i-1]
-        prev_af = af.iloc[i-1]
-        prev_ep = ep.iloc[i-1]
+    sar_value = lows[0]
+    trend = 1  # 1 = uptrend, -1 = downtrend
+    af = af_start
+    ep = highs[0]  # Extreme point
+    sar[0] = sar_value
+    
+    for i in range(1, n):
+        prev_ep = ep
+        sar_value = sar_value + af * (prev_ep - sar_value)
         
-        if prev_trend == 1:  # Uptrend
-            sar.iloc[i] = prev_sar + prev_af * (prev_ep - prev_sar)
-            sar.iloc[i] = min(sar.iloc[i], low.iloc[i-1], low.iloc[i])
+        if trend == 1:  # Uptrend
+            sar_value = min(sar_value, lows[i-1], lows[i])
             
-            if high.iloc[i] > prev_ep:
-                ep.iloc[i] = high.iloc[i]
-                af.iloc[i] = min(prev_af + af_increment, af_max)
-            else:
-                ep.iloc[i] = prev_ep
-                af.iloc[i] = prev_af
+            if highs[i] > prev_ep:
+                ep = highs[i]
+                af = min(af + af_increment, af_max)
             
-            if low.iloc[i] < sar.iloc[i]:
-                trend.iloc[i] = -1
-                sar.iloc[i] = prev_ep
-                ep.iloc[i] = low.iloc[i]
-                af.iloc[i] = af_start
-            else:
-                trend.iloc[i] = 1
+            if lows[i] < sar_value:
+                trend = -1
+                sar_value = prev_ep
+                ep = lows[i]
+                af = af_start
         else:  # Downtrend
-            sar.iloc[i] = prev_sar + prev_af * (prev_ep - prev_sar)
-            sar.iloc[i] = max(sar.iloc[i], high.iloc[i-1], high.iloc[i])
+            sar_value = max(sar_value, highs[i-1], highs[i])
             
-            if low.iloc[i] < prev_ep:
-                ep.iloc[i] = low.iloc[i]
-                af.iloc[i] = min(prev_af + af_increment, af_max)
-            else:
-                ep.iloc[i] = prev_ep
-                af.iloc[i] = prev_af
+            if lows[i] < prev_ep:
+                ep = lows[i]
+                af = min(af + af_increment, af_max)
             
-            if high.iloc[i] > sar.iloc[i]:
-                trend.iloc[i] = 1
-                sar.iloc[i] = prev_ep
-                ep.iloc[i] = high.iloc[i]
-                af.iloc[i] = af_start
-            else:
-                trend.iloc[i] = -1
+            if highs[i] > sar_value:
+                trend = 1
+                sar_value = prev_ep
+                ep = highs[i]
+                af = af_start
+        
+        sar[i] = sar_value
     
-    return sar
+    return pd.Series(sar, index=close.index)
 
 
 def ichimoku_cloud(high: pd.Series, low: pd.Series, close: pd.Series,
@@ -418,18 +495,18 @@ def obv(close: pd.Series, volume: pd.Series) -> pd.Series:
     Returns:
         pd.Series: OBV values
     """
-    obv = pd.Series(index=close.index, dtype=float)
-    obv.iloc[0] = volume.iloc[0]
+    close_values = close.to_numpy(dtype=float)
+    volume_values = volume.to_numpy(dtype=float)
     
-    for i in range(1, len(close)):
-        if close.iloc[i] > close.iloc[i-1]:
-            obv.iloc[i] = obv.iloc[i-1] + volume.iloc[i]
-        elif close.iloc[i] < close.iloc[i-1]:
-            obv.iloc[i] = obv.iloc[i-1] - volume.iloc[i]
-        else:
-            obv.iloc[i] = obv.iloc[i-1]
+    # Signed volume per bar, summed in order: +volume on an up close, -volume
+    # on a down close, nothing when unchanged (or when either close is NaN)
+    change = close_values[1:] - close_values[:-1]
+    flow = np.zeros(len(close_values))
+    flow[1:] = np.where(change > 0, volume_values[1:], np.where(change < 0, -volume_values[1:], 0.0))
+    if len(flow):
+        flow[0] = volume_values[0]
     
-    return obv
+    return pd.Series(np.cumsum(flow), index=close.index)
 
 
 def volume_sma(volume: pd.Series, period: int = 20) -> pd.Series:
@@ -447,7 +524,8 @@ def volume_sma(volume: pd.Series, period: int = 20) -> pd.Series:
 
 
 def keltner_channels(high: pd.Series, low: pd.Series, close: pd.Series,
-                    period: int = 20, multiplier: float = 2.0) -> tuple:
+                    period: int = 20, multiplier: float = 2.0,
+                    tr: Optional[np.ndarray] = None) -> tuple:
     """
     Calculate Keltner Channels.
     
@@ -457,12 +535,13 @@ def keltner_channels(high: pd.Series, low: pd.Series, close: pd.Series,
         close (pd.Series): Close prices
         period (int): EMA period (default: 20)
         multiplier (float): ATR multiplier (default: 2.0)
+        tr (np.ndarray, optional): Precomputed True Range of the same prices
         
     Returns:
         tuple: (upper_band, middle_band, lower_band)
     """
     middle_band = ema(close, period)
-    atr_values = atr(high, low, close, period)
+    atr_values = atr(high, low, close, period, tr=tr)
     
     upper_band = middle_band + (multiplier * atr_values)
     lower_band = middle_band - (multiplier * atr_values)
@@ -647,10 +726,7 @@ def true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
     Returns:
         pd.Series: True Range values
     """
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
-    return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    return pd.Series(_true_range_values(high, low, close), index=close.index)
 
 
 def change(data: pd.Series, period: int) -> pd.Series:
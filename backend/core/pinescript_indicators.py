@@ -277,10 +277,7 @@ def dema_dmi_signal(df: pd.DataFrame, len_dema: int, adx_smoothing_len: int, di_
     m = d.where((d > u) & (d > 0), 0)
     
     # Calculate True Range for DEMA
-    tr1 = df['High'] - df['Low']
-    tr2 = abs(df['High'] - df['Close'].shift(1))
-    tr3 = abs(df['Low'] - df['Close'].shift(1))
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    tr = true_range(df['High'], df['Low'], df['Close'])
     t = rma(tr, di_len)
     
     plus = fixnan(100 * rma(p, di_len) / t)
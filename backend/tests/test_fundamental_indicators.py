@@ -0,0 +1,108 @@
+"""
+Unit tests for fundamental indicators module.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from backend.core.fundamental_indicators import (
+    FUNDAMENTAL_INDICATORS, FundamentalIndicatorID,
+    get_fundamental_indicator, get_fundamental_indicators
+)
+
+
+@pytest.fixture
+def sample_df():
+    """Small OHLCV-like DataFrame with a Date index."""
+    dates = pd.date_range('2023-01-01', periods=10, freq='D')
+    return pd.DataFrame({'Close': np.linspace(100, 110, 10)}, index=dates)
+
+
+@pytest.fixture
+def stub_indicators(monkeypatch):
+    """Replace Glassnode-backed calculators with counting stubs."""
+    calls = []
+
+    def make_stub(indicator_id, value):
+        def stub(df):
+            calls.append(indicator_id)
+            return pd.Series(value, index=df.index)
+        return stub
+
+    monkeypatch.setitem(FUNDAMENTAL_INDICATORS, 'mvrv', make_stub('mvrv', 1.5))
+    monkeypatch.setitem(FUNDAMENTAL_INDICATORS, 'nupl', make_stub('nupl', 0.25))
+    return calls
+
+
+class TestFundamentalIndicators:
+    """Test cases for fundamental indicator dispatch."""
+
+    def test_get_fundamental_indicator_unknown(self, sample_df):
+        """Test that unknown IDs raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown fundamental indicator"):
+            get_fundamental_indicator(sample_df, 'not_an_indicator')
+
+    def test_indicator_id_enum_matches_registry(self):
+        """Test that enum values index the registry in declaration order."""
+        registry_ids = list(FUNDAMENTAL_INDICATORS)
+        assert len(FundamentalIndicatorID) == len(registry_ids)
+        for member in FundamentalIndicatorID:
+            assert registry_ids[member] == member.name.lower()
+
+    def test_get_fundamental_indicators_batch(self, sample_df, stub_indicators):
+        """Test batched retrieval returns one column per ID, computed once."""
+        result = get_fundamental_indicators(sample_df, ['mvrv', 'nupl', 'mvrv'])
+
+        assert isinstance(result, pd.DataFrame)
+        assert list(result.columns) == ['mvrv', 'nupl']
+        assert result.index.equals(sample_df.index)
+        assert (result['mvrv'] == 1.5).all()
+        assert (result['nupl'] == 0.25).all()
+        assert stub_indicators == ['mvrv', 'nupl']
+
+    def test_get_fundamental_indicators_validates_first(self, sample_df, stub_indicators):
+        """Test that an unknown ID fails before any indicator is computed."""
+        with pytest.raises(ValueError, match="bogus"):
+            get_fundamental_indicators(sample_df, ['mvrv', 'bogus'])
+        assert stub_indicators == []
+
+    def test_empty_dataframe_skips_api(self, monkeypatch):
+        """Test that an empty date range returns an empty Series without a client."""
+        def fail_client():
+            raise AssertionError("Glassnode client should not be requested")
+
+        monkeypatch.setattr(
+            'backend.core.fundamental_indicators.get_glassnode_client', fail_client
+        )
+        empty_df = pd.DataFrame({'Close': []}, index=pd.DatetimeIndex([]))
+
+        for indicator_id in FUNDAMENTAL_INDICATORS:
+            result = get_fundamental_indicator(empty_df, indicator_id)
+            assert isinstance(result, pd.Series)
+            assert len(result) == 0
+
+    def test_calculator_aligns_glassnode_series(self, sample_df, monkeypatch):
+        """Test that fetched data is forward/back filled onto the DataFrame index."""
+        class FakeClient:
+            def get_mvrv(self, asset, start_date, end_date, use_cache=True):
+                return pd.Series([2.0, 3.0], index=sample_df.index[[2, 6]])
+
+        monkeypatch.setattr(
+            'backend.core.fundamental_indicators.get_glassnode_client', FakeClient
+        )
+        result = get_fundamental_indicator(sample_df, 'mvrv')
+
+        assert result.index.equals(sample_df.index)
+        assert result.tolist() == [2.0] * 6 + [3.0] * 4
+
+    def test_calculator_raises_on_missing_data(self, sample_df, monkeypatch):
+        """Test that an empty Glassnode response raises ValueError."""
+        class FakeClient:
+            def get_exchange_netflows(self, asset, start_date, end_date, use_cache=True):
+                return pd.Series(dtype=float)
+
+        monkeypatch.setattr(
+            'backend.core.fundamental_indicators.get_glassnode_client', FakeClient
+        )
+        with pytest.raises(ValueError, match="Exchange Net Position"):
+            get_fundamental_indicator(sample_df, 'exchange_net_position')
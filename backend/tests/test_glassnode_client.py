@@ -0,0 +1,507 @@
+"""
+Unit tests for Glassnode client caching and rate limiting.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+import pytest
+import requests
+import pandas as pd
+import numpy as np
+from backend.core import glassnode_client
+from backend.core.glassnode_client import (
+    GlassnodeClient, NOT_MODIFIED, RateLimiter, _ResponseCache, _generate_cache_key, _to_epoch
+)
+
+
+@pytest.fixture
+def cache():
+    """Empty response cache, independent of any client."""
+    return _ResponseCache()
+
+
+@pytest.fixture
+def sample_series():
+    """Small metric Series shaped like a parsed Glassnode response."""
+    dates = pd.date_range('2023-01-01', periods=5, freq='D')
+    return pd.Series(np.arange(5, dtype=float), index=dates, name='Value')
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace monotonic time with a manually advanced clock."""
+    clock = {'now': 1000.0}
+    monkeypatch.setattr(glassnode_client.time, 'monotonic', lambda: clock['now'])
+    return clock
+
+
+class TestRateLimiter:
+    """Test cases for the token bucket rate limiter."""
+
+    def test_burst_up_to_capacity(self, fake_clock):
+        """Test that a full bucket allows max_requests without waiting."""
+        limiter = RateLimiter(max_requests=3, window_seconds=30)
+        for _ in range(3):
+            limiter.wait_if_needed()
+
+        assert limiter.get_remaining_requests() == 0
+
+    def test_refills_over_time(self, fake_clock):
+        """Test that tokens accrue at max_requests per window, capped at capacity."""
+        limiter = RateLimiter(max_requests=3, window_seconds=30)
+        for _ in range(3):
+            limiter.wait_if_needed()
+
+        fake_clock['now'] += 20
+        assert limiter.get_remaining_requests() == 2
+        fake_clock['now'] += 1000
+        assert limiter.get_remaining_requests() == 3
+
+    def test_waits_for_next_token(self):
+        """Test that an empty bucket blocks until one token has refilled."""
+        limiter = RateLimiter(max_requests=2, window_seconds=0.2)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait_if_needed()
+
+        assert time.monotonic() - start >= 0.09
+
+    def test_concurrent_callers_share_budget(self):
+        """Test that threads together cannot exceed the bucket's rate."""
+        limiter = RateLimiter(max_requests=4, window_seconds=0.2)
+        start = time.monotonic()
+        threads = [threading.Thread(target=limiter.wait_if_needed) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        # 4 immediate requests, then 4 more at 0.05 s intervals
+        assert time.monotonic() - start >= 0.19
+        assert limiter.get_remaining_requests() == 0
+
+
+class TestGlassnodeCache:
+    """Test cases for the in-memory response cache."""
+
+    def test_store_and_get(self, cache, sample_series):
+        """Test that a stored response is returned on the next lookup."""
+        cache.store('key', sample_series)
+        cached = cache.get('key')
+
+        assert cached is not None
+        pd.testing.assert_series_equal(cached, sample_series)
+
+    def test_cached_values_are_read_only(self, cache, sample_series):
+        """Test that hits share the cached buffer but cannot mutate it."""
+        cache.store('key', sample_series)
+        first = cache.get('key')
+        second = cache.get('key')
+
+        assert np.shares_memory(first.to_numpy(), second.to_numpy())
+        with pytest.raises(ValueError):
+            first.iloc[0] = 100.0
+        assert cache.get('key').iloc[0] == 0.0
+
+    def test_cache_key_is_day_granular(self):
+        """Test that requests for the same days share a cache key."""
+        morning = _generate_cache_key('indicators/mvrv', 'BTC', pd.Timestamp('2023-01-01 08:00'),
+                                      pd.Timestamp('2023-02-01 09:30'))
+        evening = _generate_cache_key('indicators/mvrv', 'BTC', pd.Timestamp('2023-01-01 20:00'),
+                                      pd.Timestamp('2023-02-01 23:59'))
+        other_metric = _generate_cache_key('indicators/nupl', 'BTC', pd.Timestamp('2023-01-01'),
+                                           pd.Timestamp('2023-02-01'))
+
+        assert morning == evening
+        assert morning != other_metric
+        assert _generate_cache_key('indicators/mvrv', 'BTC', None, None)[3:5] == (None, None)
+
+    def test_cache_key_snaps_to_hour_for_hourly_interval(self):
+        """Test that hourly requests share a key within the hour only."""
+        start = pd.Timestamp('2023-01-01')
+        key_a = _generate_cache_key('indicators/mvrv', 'BTC', start, pd.Timestamp('2023-01-02 10:05'), '1h')
+        key_b = _generate_cache_key('indicators/mvrv', 'BTC', start, pd.Timestamp('2023-01-02 10:55'), '1h')
+        key_c = _generate_cache_key('indicators/mvrv', 'BTC', start, pd.Timestamp('2023-01-02 11:05'), '1h')
+
+        assert key_a == key_b
+        assert key_a != key_c
+
+    def test_to_epoch(self):
+        """Test that request epochs are snapped to the interval grid."""
+        afternoon = pd.Timestamp('2023-01-02 15:30')
+
+        assert _to_epoch(afternoon, '24h') == 1672617600
+        assert _to_epoch(afternoon, '1h') == 1672617600 + 15 * 3600
+
+    @pytest.mark.skipif(not hasattr(time, 'tzset'), reason="needs time.tzset")
+    def test_to_epoch_naive_dates_are_utc(self):
+        """Test that naive datetimes map to UTC epochs whatever the host timezone."""
+        original_tz = os.environ.get('TZ')
+        os.environ['TZ'] = 'America/New_York'
+        time.tzset()
+        try:
+            afternoon = datetime(2023, 1, 2, 15, 30)
+
+            assert _to_epoch(afternoon, '24h') == 1672617600
+            assert _to_epoch(afternoon, '1h') == 1672617600 + 15 * 3600
+            assert _to_epoch(afternoon, '10m') == 1672617600 + 15 * 3600 + 30 * 60
+        finally:
+            if original_tz is None:
+                del os.environ['TZ']
+            else:
+                os.environ['TZ'] = original_tz
+            time.tzset()
+
+    def test_missing_key(self, cache):
+        """Test that unknown keys miss."""
+        assert cache.get('missing') is None
+
+    def test_expired_entry_removed_on_access(self, cache, sample_series, monkeypatch):
+        """Test that an entry older than the TTL is dropped when read."""
+        cache.store('key', sample_series)
+        stored_at = cache.entries['key'].timestamp
+        monkeypatch.setattr(glassnode_client.time, 'monotonic',
+                            lambda: stored_at + glassnode_client.CACHE_TTL + 1)
+
+        assert cache.get('key') is None
+        assert 'key' not in cache.entries
+
+    def test_maxsize_evicts_oldest(self, sample_series):
+        """Test that the oldest entry is evicted once the cache is full."""
+        cache = _ResponseCache(maxsize=2)
+        for key in ('a', 'b', 'c'):
+            cache.store(key, sample_series)
+
+        assert list(cache.entries) == ['b', 'c']
+
+
+class TestGlassnodeDiskCache:
+    """Test cases for the persistent SQLite cache tier."""
+
+    @pytest.fixture(autouse=True)
+    def disk_cache(self, tmp_path, monkeypatch):
+        """Point the persistent tier at a temporary database."""
+        path = tmp_path / 'glassnode_cache.sqlite'
+        monkeypatch.setattr(glassnode_client, 'GLASSNODE_CACHE_PATH', str(path))
+        return path
+
+    def test_survives_memory_loss(self, cache, sample_series):
+        """Test that a response is reloaded from disk after the memory tier is cleared."""
+        cache.store('key', sample_series)
+        cache.entries.clear()
+
+        cached = cache.get('key')
+        assert cached is not None
+        pd.testing.assert_series_equal(cached, sample_series)
+        assert 'key' in cache.entries
+
+    def test_expired_disk_entry_ignored(self, cache, sample_series, monkeypatch):
+        """Test that disk entries older than the TTL miss."""
+        cache.store('key', sample_series)
+        cache.entries.clear()
+        now = time.time()
+        monkeypatch.setattr(glassnode_client.time, 'time',
+                            lambda: now + glassnode_client.CACHE_TTL + 1)
+
+        assert cache.get('key') is None
+
+    def test_corrupt_disk_entry_is_refetched(self, disk_cache, monkeypatch):
+        """Test that an unreadable disk row is deleted and get_metric refetches."""
+        import sqlite3
+        client = GlassnodeClient(api_key='test-key')
+        payload = [{'t': 1672531200, 'v': 1.0}]
+        calls = []
+
+        def fake_make_request(endpoint, params, **kwargs):
+            calls.append(endpoint)
+            return payload
+
+        monkeypatch.setattr(client, '_make_request', fake_make_request)
+        start, end = pd.Timestamp('2023-01-01'), pd.Timestamp('2023-01-02')
+        client.get_metric('indicators/mvrv', start_date=start, end_date=end)
+        client.cache.clear()
+        with sqlite3.connect(disk_cache) as conn:
+            conn.execute("UPDATE glassnode_cache SET payload = ?", (b'garbage',))
+
+        series = client.get_metric('indicators/mvrv', start_date=start, end_date=end)
+
+        assert series.tolist() == [1.0]
+        assert len(calls) == 2
+        with sqlite3.connect(disk_cache) as conn:
+            payloads = [row[0] for row in conn.execute("SELECT payload FROM glassnode_cache")]
+        assert payloads and b'garbage' not in payloads
+
+    def test_connection_reused(self, cache, sample_series):
+        """Test that one thread reuses a single connection for the persistent tier."""
+        cache.store('a', sample_series)
+        cache.store('b', sample_series)
+
+        assert glassnode_client._disk_cache_connect() is glassnode_client._disk_cache_connect()
+
+    def test_promoted_entry_expires_behind_newer_entries(self, cache, sample_series,
+                                                          fake_clock, monkeypatch):
+        """Test that a promoted disk entry keeps its age and is swept once expired."""
+        wall = {'now': 1_000_000.0}
+        monkeypatch.setattr(glassnode_client.time, 'time', lambda: wall['now'])
+        ttl = glassnode_client.CACHE_TTL
+        cache.store('old', sample_series)
+        cache.entries.clear()
+        wall['now'] += ttl * 0.9
+        fake_clock['now'] += ttl * 0.9
+        cache.store('new', sample_series)
+
+        assert cache.get('old') is not None
+        assert list(cache.entries) == ['new', 'old']
+
+        fake_clock['now'] += ttl * 0.2
+        cache.clean_expired()
+        assert list(cache.entries) == ['new']
+
+    def test_disabled_without_path(self, cache, sample_series, monkeypatch):
+        """Test that no persistent tier is used when the path is unset."""
+        monkeypatch.setattr(glassnode_client, 'GLASSNODE_CACHE_PATH', '')
+        cache.store('key', sample_series)
+        cache.entries.clear()
+
+        assert cache.get('key') is None
+
+
+class TestGlassnodeClient:
+    """Test cases for GlassnodeClient response handling."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Client whose HTTP layer returns a canned, unsorted payload."""
+        client = GlassnodeClient(api_key='test-key')
+        payload = [
+            {'t': 1672617600, 'v': 2.0},  # 2023-01-02
+            {'t': 1672531200, 'v': 1.0},  # 2023-01-01
+            {'t': 1672704000, 'v': None},  # 2023-01-03
+            {'t': 1672790400},  # malformed, no value
+        ]
+        monkeypatch.setattr(client, '_make_request', lambda endpoint, params, **kwargs: payload)
+        return client
+
+    def test_get_metric_parses_records(self, client):
+        """Test that records become a sorted, date-indexed float Series."""
+        series = client.get_metric('indicators/mvrv', start_date=pd.Timestamp('2023-01-01'),
+                                   end_date=pd.Timestamp('2023-01-04'), use_cache=False)
+
+        assert list(series.index) == list(pd.date_range('2023-01-01', periods=3, freq='D'))
+        assert series.index.name == 'Date'
+        assert series.name == 'Value'
+        assert series.iloc[0] == 1.0
+        assert series.iloc[1] == 2.0
+        assert np.isnan(series.iloc[2])
+        assert series.dtype == np.float64
+
+    def test_mutating_miss_result_leaves_cache_intact(self, client):
+        """Test that editing the Series returned on a cache miss does not reach the cache."""
+        start, end = pd.Timestamp('2023-01-01'), pd.Timestamp('2023-01-04')
+        series = client.get_metric('indicators/mvrv', start_date=start, end_date=end)
+        series.iloc[0] = 123.0
+
+        cached = client.get_metric('indicators/mvrv', start_date=start, end_date=end)
+        assert cached.iloc[0] == 1.0
+
+    def test_get_metric_single_precision(self, client):
+        """Test that precision='f32' opts into float32 values and a separate cache entry."""
+        start, end = pd.Timestamp('2023-01-01'), pd.Timestamp('2023-01-04')
+        single = client.get_metric('indicators/mvrv', start_date=start, end_date=end, precision='f32')
+        double = client.get_metric('indicators/mvrv', start_date=start, end_date=end)
+
+        assert single.dtype == np.float32
+        assert double.dtype == np.float64
+        assert len(client.cache.entries) == 2
+
+        with pytest.raises(ValueError, match="precision"):
+            client.get_metric('indicators/mvrv', precision='f16')
+
+    def test_empty_response_is_negative_cached(self, monkeypatch):
+        """Test that an empty response is cached briefly and can be invalidated."""
+        client = GlassnodeClient(api_key='test-key')
+        calls = []
+
+        def fake_make_request(endpoint, params, **kwargs):
+            calls.append(endpoint)
+            return []
+
+        monkeypatch.setattr(client, '_make_request', fake_make_request)
+        start, end = pd.Timestamp('2023-01-01'), pd.Timestamp('2023-01-04')
+        for _ in range(2):
+            assert client.get_metric('indicators/mvrv', start_date=start, end_date=end).empty
+        assert len(calls) == 1
+
+        client.invalidate('indicators/mvrv', start_date=start, end_date=end)
+        client.get_metric('indicators/mvrv', start_date=start, end_date=end)
+        assert len(calls) == 2
+
+        stored_at = next(iter(client.cache.negative.values()))
+        monkeypatch.setattr(glassnode_client.time, 'monotonic',
+                            lambda: stored_at + glassnode_client.NEGATIVE_CACHE_TTL + 1)
+        client.get_metric('indicators/mvrv', start_date=start, end_date=end)
+        assert len(calls) == 3
+
+    def test_clients_have_separate_caches(self, client, sample_series):
+        """Test that each client owns its response cache."""
+        client.cache.store('key', sample_series)
+
+        assert GlassnodeClient(api_key='test-key').cache.get('key') is None
+
+    def test_get_metrics_fetches_each_metric_once(self, monkeypatch):
+        """Test that get_metrics returns one Series per unique metric, in order."""
+        client = GlassnodeClient(api_key='test-key')
+        requested = []
+        lock = threading.Lock()
+
+        def fake_get_metric(metric, asset, start_date, end_date, interval, use_cache, precision):
+            with lock:
+                requested.append(metric)
+            return pd.Series([float(len(metric))], name='Value')
+
+        monkeypatch.setattr(client, 'get_metric', fake_get_metric)
+        result = client.get_metrics(['indicators/nupl', 'indicators/mvrv', 'indicators/nupl'])
+
+        assert list(result) == ['indicators/nupl', 'indicators/mvrv']
+        assert sorted(requested) == ['indicators/mvrv', 'indicators/nupl']
+        assert result['indicators/mvrv'].iloc[0] == len('indicators/mvrv')
+
+    def test_get_glassnode_client_is_singleton(self):
+        """Test that the global client is created once and can be reset."""
+        glassnode_client.get_glassnode_client.cache_clear()
+        first = glassnode_client.get_glassnode_client()
+
+        assert glassnode_client.get_glassnode_client() is first
+        glassnode_client.get_glassnode_client.cache_clear()
+        assert glassnode_client.get_glassnode_client() is not first
+        glassnode_client.get_glassnode_client.cache_clear()
+
+    def test_api_key_sent_from_session_params(self):
+        """Test that the API key is merged into requests without copying caller params."""
+        client = GlassnodeClient(api_key='test-key')
+        params = {'a': 'BTC', 'i': '24h'}
+        request = client.session.prepare_request(
+            requests.Request('GET', f"{client.base_url}/v1/metrics/indicators/mvrv", params=params)
+        )
+
+        assert 'api_key=test-key' in request.url
+        assert 'a=BTC' in request.url
+        assert params == {'a': 'BTC', 'i': '24h'}
+
+    def test_adapter_only_retries_connects(self):
+        """Test that the adapter never resends a request that reached the server."""
+        retries = GlassnodeClient(api_key='test-key').session.get_adapter('https://').max_retries
+
+        assert retries.connect == 3
+        assert retries.read == 0
+        assert retries.status == 0
+        assert not retries.status_forcelist
+
+    def test_named_getters_use_metric_table(self, monkeypatch):
+        """Test that get_<name> getters request their endpoint from the table."""
+        client = GlassnodeClient(api_key='test-key')
+        requested = []
+
+        def fake_make_request(endpoint, params, **kwargs):
+            requested.append((endpoint, params['a']))
+            return []
+
+        monkeypatch.setattr(client, '_make_request', fake_make_request)
+        for name in GlassnodeClient.METRICS:
+            getattr(client, f'get_{name}')('BTC', use_cache=False)
+
+        assert requested == [(f"/v1/metrics/{endpoint}", 'BTC')
+                             for endpoint in GlassnodeClient.METRICS.values()]
+        for name in GlassnodeClient.METRICS:
+            getter = getattr(GlassnodeClient, f'get_{name}')
+            assert getter.__name__ == f'get_{name}'
+            assert getter.__qualname__ == f'GlassnodeClient.get_{name}'
+
+    def test_named_getters_keep_positional_use_cache(self, monkeypatch):
+        """Test that the fourth positional getter argument is still use_cache."""
+        client = GlassnodeClient(api_key='test-key')
+        received = {}
+
+        def fake_get_metric(metric, asset, start_date, end_date, interval, use_cache, precision):
+            received.update(metric=metric, interval=interval, use_cache=use_cache)
+            return pd.Series(dtype=float)
+
+        monkeypatch.setattr(client, 'get_metric', fake_get_metric)
+        client.get_mvrv('BTC', None, None, False)
+
+        assert received == {'metric': 'indicators/mvrv', 'interval': '24h', 'use_cache': False}
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_make_request_parses_json(self, monkeypatch, use_orjson):
+        """Test that response bodies parse the same with and without orjson."""
+        if use_orjson:
+            pytest.importorskip('orjson')
+        monkeypatch.setattr(glassnode_client, 'ORJSON_AVAILABLE', use_orjson)
+        client = GlassnodeClient(api_key='test-key')
+        body = b'[{"t": 1672531200, "v": 1.5}]'
+
+        class FakeResponse:
+            status_code = 200
+            headers = {}
+            content = body
+
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                import json
+                return json.loads(body)
+
+        monkeypatch.setattr(client.session, 'get', lambda url, params, headers, timeout: FakeResponse())
+        monkeypatch.setattr(glassnode_client._rate_limiter, 'wait_if_needed', lambda: None)
+
+        assert client._make_request('/v1/metrics/indicators/mvrv', {}) == [{'t': 1672531200, 'v': 1.5}]
+
+    def test_expired_entry_revalidated_with_etag(self, monkeypatch):
+        """Test that an expired entry is reused when the server answers 304."""
+        client = GlassnodeClient(api_key='test-key')
+        start, end = pd.Timestamp('2023-01-01'), pd.Timestamp('2023-01-05')
+        cache_key = _generate_cache_key('indicators/mvrv', 'BTC', start, end)
+        cached = pd.Series([1.0, 2.0], index=pd.date_range('2023-01-01', periods=2), name='Value')
+        client.cache.store(cache_key, cached, {'ETag': '"abc"'})
+
+        stored_at = client.cache.entries[cache_key].timestamp
+        monkeypatch.setattr(glassnode_client.time, 'monotonic',
+                            lambda: stored_at + glassnode_client.CACHE_TTL + 1)
+        sent = {}
+
+        def fake_make_request(endpoint, params, validators=None, response_validators=None):
+            sent.update(validators or {})
+            return NOT_MODIFIED
+
+        monkeypatch.setattr(client, '_make_request', fake_make_request)
+        result = client.get_metric('indicators/mvrv', start_date=start, end_date=end)
+
+        assert sent == {'ETag': '"abc"'}
+        pd.testing.assert_series_equal(result, cached, check_freq=False)
+        assert client.cache.get(cache_key) is not None
+
+    def test_make_request_sends_conditional_headers(self, monkeypatch):
+        """Test that validators become conditional headers and 304 returns NOT_MODIFIED."""
+        client = GlassnodeClient(api_key='test-key')
+        sent_headers = {}
+
+        class NotModifiedResponse:
+            status_code = 304
+
+        def fake_get(url, params, headers, timeout):
+            sent_headers.update(headers)
+            return NotModifiedResponse()
+
+        monkeypatch.setattr(client.session, 'get', fake_get)
+        monkeypatch.setattr(glassnode_client._rate_limiter, 'wait_if_needed', lambda: None)
+        result = client._make_request(
+            '/v1/metrics/indicators/mvrv', {},
+            validators={'ETag': '"abc"', 'Last-Modified': 'Mon, 02 Jan 2023 00:00:00 GMT'}
+        )
+
+        assert result is NOT_MODIFIED
+        assert sent_headers == {'If-None-Match': '"abc"',
+                                'If-Modified-Since': 'Mon, 02 Jan 2023 00:00:00 GMT'}
@@ -2,14 +2,18 @@
 Unit tests for indicator registry.
 """
 
+import dataclasses
+from collections.abc import Mapping
 import pytest
 import pandas as pd
 import numpy as np
 from backend.core.indicator_registry import (
-    IndicatorMetadata, INDICATOR_REGISTRY, get_indicator_metadata,
+    IndicatorMetadata, IndicatorID, INDICATOR_REGISTRY, get_indicator_metadata,
     get_all_indicators, get_available_conditions, compute_indicators,
-    evaluate_all_conditions
+    evaluate_all_conditions, evaluate_all_conditions_packed, pack_condition_bits,
+    unpack_condition_bits, clear_indicator_cache, _rolling_mean
 )
+from backend.core.indicators import keltner_channels
 
 
 class TestIndicatorRegistry:
@@ -30,6 +34,19 @@ class TestIndicatorRegistry:
             assert callable(metadata.compute_fn)
             assert callable(metadata.evaluate_conditions_fn)
     
+    def test_metadata_is_read_only(self):
+        """Test that registry metadata cannot be mutated in place."""
+        metadata = INDICATOR_REGISTRY["RSI"]
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            metadata.name = "Other"
+        with pytest.raises(TypeError):
+            metadata.conditions["RSI_new"] = "New condition"
+        with pytest.raises(TypeError):
+            metadata.parameters["period"] = {}
+        assert not hasattr(metadata, '__dict__')
+        assert {metadata: 1}[INDICATOR_REGISTRY["RSI"]] == 1
+    
     def test_get_indicator_metadata(self):
         """Test getting indicator metadata."""
         # Valid indicator
@@ -41,14 +58,24 @@ class TestIndicatorRegistry:
         with pytest.raises(ValueError, match="Unknown indicator"):
             get_indicator_metadata("INVALID")
     
+    def test_indicator_id_enum_matches_registry(self):
+        """Test that enum values index the registry in declaration order."""
+        registry_ids = list(INDICATOR_REGISTRY)
+        assert len(IndicatorID) == len(registry_ids)
+        for member in IndicatorID:
+            assert registry_ids[member].upper() == member.name
+            assert get_indicator_metadata(member) is INDICATOR_REGISTRY[registry_ids[member]]
+    
     def test_get_all_indicators(self):
         """Test getting all indicators."""
         indicators = get_all_indicators()
-        assert isinstance(indicators, dict)
+        assert isinstance(indicators, Mapping)
         assert len(indicators) > 0
+        assert indicators.keys() == INDICATOR_REGISTRY.keys()
         
-        # Check that it's a copy
-        indicators["TEST"] = "test"
+        # Check that it's read-only
+        with pytest.raises(TypeError):
+            indicators["TEST"] = "test"
         assert "TEST" not in INDICATOR_REGISTRY
     
     def test_rsi_metadata(self):
@@ -136,6 +163,21 @@ class TestIndicatorComputation:
             assert isinstance(conditions[condition], pd.Series)
             assert len(conditions[condition]) == len(result_df)
     
+    def test_rsi_cross_conditions_match_shift(self):
+        """Test that RSI crossovers match the shift(1) comparison, including NaN rows."""
+        df = pd.DataFrame(
+            {'RSI_14': [np.nan, 25.0, 35.0, 75.0, 65.0, np.nan, 40.0]},
+            index=pd.date_range('2020-01-01', periods=7, freq='D')
+        )
+        params = {"period": 14, "oversold": 30, "overbought": 70}
+        conditions = INDICATOR_REGISTRY["RSI"].evaluate_conditions_fn(df, params)
+        rsi_col = df['RSI_14']
+        
+        expected_above = (rsi_col > 30) & (rsi_col.shift(1) <= 30)
+        expected_below = (rsi_col < 70) & (rsi_col.shift(1) >= 70)
+        pd.testing.assert_series_equal(conditions['rsi_cross_above_oversold'], expected_above, check_names=False)
+        pd.testing.assert_series_equal(conditions['rsi_cross_below_overbought'], expected_below, check_names=False)
+    
     def test_macd_computation(self):
         """Test MACD indicator computation."""
         df = self.create_sample_dataframe(50)
@@ -200,6 +242,55 @@ class TestIndicatorComputation:
             assert condition in conditions
             assert isinstance(conditions[condition], pd.Series)
 
+    
+    def test_atr_cross_conditions_match_shift(self):
+        """Test ATR crossovers against fixed thresholds match the shift(1) comparison."""
+        df = pd.DataFrame(
+            {'ATR_14': [np.nan, 0.5, 1.5, 2.5, 1.8, 0.8, np.nan, 2.2]},
+            index=pd.date_range('2020-01-01', periods=8, freq='D')
+        )
+        params = {"period": 14, "high_threshold": 2.0, "low_threshold": 1.0}
+        conditions = INDICATOR_REGISTRY["ATR"].evaluate_conditions_fn(df, params)
+        atr_col = df['ATR_14']
+        
+        expected = {
+            'atr_cross_above_high': (atr_col > 2.0) & (atr_col.shift(1) <= 2.0),
+            'atr_cross_below_low': (atr_col < 1.0) & (atr_col.shift(1) >= 1.0),
+            'atr_rising': atr_col > atr_col.shift(1),
+            'atr_falling': atr_col < atr_col.shift(1)
+        }
+        for name, expected_series in expected.items():
+            pd.testing.assert_series_equal(conditions[name], expected_series, check_names=False)
+
+
+class TestConditionHelpers:
+    """Test cases for the NumPy helpers used by condition evaluators."""
+    
+    @pytest.mark.parametrize("n", [5, 19, 20, 100])
+    def test_rolling_mean_matches_pandas(self, n):
+        """Test that the running-sum rolling mean matches pandas, including NaN gaps."""
+        values = np.random.default_rng(0).normal(100, 5, n)
+        values[:3] = np.nan
+        if n > 50:
+            values[40] = np.nan
+        
+        expected = pd.Series(values).rolling(20).mean().to_numpy()
+        np.testing.assert_allclose(_rolling_mean(values, 20), expected, rtol=1e-12)
+
+    
+    @pytest.mark.parametrize("n", [0, 1, 63, 64, 65, 200])
+    def test_condition_bits_round_trip(self, n):
+        """Test that bit-packed conditions unpack, and combine, row for row."""
+        packed = np.random.default_rng(n).random((n, 3)) < 0.5
+        bits = pack_condition_bits(packed)
+        
+        assert bits.dtype == np.uint64
+        assert bits.shape == (3, -(-n // 64))
+        np.testing.assert_array_equal(unpack_condition_bits(bits, n), packed)
+        np.testing.assert_array_equal(
+            unpack_condition_bits(bits[0] & bits[2], n), packed[:, 0] & packed[:, 2]
+        )
+
 
 class TestRegistryFunctions:
     """Test cases for registry utility functions."""
@@ -222,6 +313,16 @@ class TestRegistryFunctions:
         # Should be sorted and unique
         assert conditions == sorted(list(set(conditions)))
     
+    def test_get_available_conditions_returns_fresh_list(self):
+        """Test that cached results are not shared with callers."""
+        indicators = [{"id": "SMA", "params": {}}, {"id": "INVALID", "params": {}}]
+        
+        conditions = get_available_conditions(indicators)
+        assert conditions == sorted(INDICATOR_REGISTRY["SMA"].conditions)
+        
+        conditions.append("mutated")
+        assert "mutated" not in get_available_conditions(indicators)
+    
     def test_compute_indicators(self):
         """Test computing multiple indicators."""
         df = pd.DataFrame({
@@ -248,6 +349,26 @@ class TestRegistryFunctions:
         assert "Close" in result_df.columns
         assert "Volume" in result_df.columns
     
+    def test_indicator_ids_accepted_in_configs(self):
+        """Test that IndicatorID configs give the same results as string keys."""
+        df = pd.DataFrame({
+            'Open': np.random.randn(50).cumsum() + 100,
+            'High': np.random.randn(50).cumsum() + 105,
+            'Low': np.random.randn(50).cumsum() + 95,
+            'Close': np.random.randn(50).cumsum() + 100
+        }, index=pd.date_range('2020-01-01', periods=50, freq='D'))
+        
+        by_name = [{"id": "RSI", "params": {"period": 14}}, {"id": "SMA", "params": {"period": 20}}]
+        by_enum = [{"id": IndicatorID.RSI, "params": {"period": 14}}, {"id": IndicatorID.SMA, "params": {"period": 20}}]
+        
+        pd.testing.assert_frame_equal(compute_indicators(df, by_enum), compute_indicators(df, by_name))
+        
+        named_conditions = evaluate_all_conditions(df, by_name)
+        enum_conditions = evaluate_all_conditions(df, by_enum)
+        assert named_conditions.keys() == enum_conditions.keys()
+        for name, condition in named_conditions.items():
+            pd.testing.assert_series_equal(enum_conditions[name], condition)
+    
     def test_evaluate_all_conditions(self):
         """Test evaluating all conditions for multiple indicators."""
         df = pd.DataFrame({
@@ -281,6 +402,231 @@ class TestRegistryFunctions:
             assert isinstance(condition_series, pd.Series)
             assert condition_series.dtype == bool
             assert len(condition_series) == len(df_with_indicators)
+    
+    def test_evaluate_all_conditions_packed(self):
+        """Test that the packed matrix holds the same conditions, column per name."""
+        df = pd.DataFrame({
+            'Open': np.random.randn(50).cumsum() + 100,
+            'High': np.random.randn(50).cumsum() + 105,
+            'Low': np.random.randn(50).cumsum() + 95,
+            'Close': np.random.randn(50).cumsum() + 100,
+            'Volume': np.random.randint(1000, 10000, 50)
+        }, index=pd.date_range('2020-01-01', periods=50, freq='D'))
+        indicators = [
+            {"id": "RSI", "params": {"period": 14}},
+            {"id": "MACD", "params": {}},
+            {"id": "OBV", "params": {}},
+            {"id": "RSITrail", "params": {}}
+        ]
+        
+        conditions = evaluate_all_conditions(df, indicators)
+        packed, names = evaluate_all_conditions_packed(df, indicators)
+        
+        assert packed.shape == (len(df), len(conditions))
+        assert packed.dtype == bool
+        assert names == list(conditions)
+        for col, name in enumerate(names):
+            np.testing.assert_array_equal(packed[:, col], conditions[name].to_numpy())
+    
+    def test_evaluate_selected_conditions(self):
+        """Test that condition_names limits the result to the requested conditions."""
+        df = pd.DataFrame({
+            'Close': np.random.randn(50).cumsum() + 100
+        }, index=pd.date_range('2020-01-01', periods=50, freq='D'))
+        indicators = [
+            {"id": "RSI", "params": {"period": 14}},
+            {"id": "SMA", "params": {"period": 20}}
+        ]
+        
+        all_conditions = evaluate_all_conditions(df, indicators)
+        selected = evaluate_all_conditions(df, indicators, ["rsi_oversold", "sma_price_above", "unknown"])
+        
+        assert list(selected) == ["rsi_oversold", "sma_price_above"]
+        for name, condition in selected.items():
+            pd.testing.assert_series_equal(condition, all_conditions[name])
+        
+        packed, names = evaluate_all_conditions_packed(df, indicators, ["sma_price_above"])
+        assert names == ["sma_price_above"]
+        np.testing.assert_array_equal(packed[:, 0], all_conditions["sma_price_above"].to_numpy())
+
+
+class TestIndicatorCache:
+    """Test cases for memoized indicator computation."""
+    
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start and finish every test with an empty indicator cache."""
+        clear_indicator_cache()
+        yield
+        clear_indicator_cache()
+    
+    @pytest.fixture
+    def counted_rsi(self, monkeypatch):
+        """Count calls to the RSI compute function."""
+        calls = []
+        metadata = INDICATOR_REGISTRY["RSI"]
+        original = metadata.compute_fn
+        
+        def counting_compute(df, params):
+            calls.append(params)
+            return original(df, params)
+        
+        monkeypatch.setitem(
+            INDICATOR_REGISTRY, "RSI", dataclasses.replace(metadata, compute_fn=counting_compute)
+        )
+        return calls
+    
+    def create_df(self, seed=0):
+        """Create a small Close-only DataFrame."""
+        rng = np.random.default_rng(seed)
+        return pd.DataFrame(
+            {'Close': rng.normal(0, 1, 60).cumsum() + 100},
+            index=pd.date_range('2020-01-01', periods=60, freq='D', name='Date')
+        )
+    
+    def test_repeat_call_uses_cache(self, counted_rsi):
+        """Test that the same data and params are computed once across calls."""
+        df = self.create_df()
+        indicators = [{"id": "RSI", "params": {"period": 14}}]
+        
+        first = compute_indicators(df, indicators)
+        second = compute_indicators(df.copy(), indicators)
+        
+        assert len(counted_rsi) == 1
+        pd.testing.assert_frame_equal(first, second)
+        
+        # Results are independent copies of the cached values
+        second.iloc[20, second.columns.get_loc('RSI_14')] = -1.0
+        third = compute_indicators(df, indicators)
+        pd.testing.assert_frame_equal(first, third)
+    
+    def test_duplicate_configs_computed_once(self, counted_rsi):
+        """Test that repeated configs within one call are computed once."""
+        compute_indicators(self.create_df(), [
+            {"id": "RSI", "params": {"period": 14}},
+            {"id": "RSI", "params": {"period": 14}},
+            {"id": "RSI", "params": {"period": 10}}
+        ])
+        
+        assert counted_rsi == [{"period": 14}, {"period": 10}]
+    
+    def test_close_emas_shared_across_indicators(self, monkeypatch):
+        """Test that MACD and EMA_Cross reuse the same EMAs of Close in one call."""
+        from backend.core import indicator_registry
+        periods = []
+        original_ema = indicator_registry.ema
+        
+        def counting_ema(data, window, alpha=None):
+            periods.append(window)
+            return original_ema(data, window, alpha)
+        
+        monkeypatch.setattr(indicator_registry, 'ema', counting_ema)
+        result_df = compute_indicators(self.create_df(), [
+            {"id": "MACD", "params": {"fast": 12, "slow": 26, "signal": 9}},
+            {"id": "EMA_Cross", "params": {"fast_period": 12, "slow_period": 26}},
+            {"id": "EMA", "params": {"period": 12}}
+        ])
+        
+        # One EMA per Close period, plus MACD's signal EMA of the MACD line
+        assert sorted(periods) == [9, 12, 26]
+        pd.testing.assert_series_equal(
+            result_df['MACD_12_26'], result_df['EMA_Fast_12'] - result_df['EMA_Slow_26'], check_names=False
+        )
+    
+    def test_true_range_shared_across_indicators(self, monkeypatch):
+        """Test that ATR, ADX and Keltner reuse one True Range in one call."""
+        from backend.core import indicator_registry
+        calls = []
+        original_true_range = indicator_registry._true_range_values
+        
+        def counting_true_range(high, low, close):
+            calls.append(len(close))
+            return original_true_range(high, low, close)
+        
+        monkeypatch.setattr(indicator_registry, '_true_range_values', counting_true_range)
+        df = self.create_df()
+        df['High'] = df['Close'] + 1
+        df['Low'] = df['Close'] - 1
+        indicators = [
+            {"id": "ATR", "params": {"period": 14}},
+            {"id": "ADX", "params": {"period": 14}},
+            {"id": "Keltner", "params": {"period": 20}}
+        ]
+        result_df = compute_indicators(df, indicators)
+        
+        assert calls == [len(df)]
+        clear_indicator_cache()
+        for indicator in indicators:
+            single = compute_indicators(df, [indicator])
+            for col in single.columns.difference(df.columns):
+                pd.testing.assert_series_equal(result_df[col], single[col])
+    
+    def test_keltner_shares_ema_and_atr(self, monkeypatch):
+        """Test that Keltner reuses the EMA and ATR of EMA/ATR configs with its period."""
+        from backend.core import indicator_registry
+        ema_periods = []
+        atr_periods = []
+        original_ema = indicator_registry.ema
+        original_atr = indicator_registry.atr
+        
+        def counting_ema(data, window, *args, **kwargs):
+            ema_periods.append(window)
+            return original_ema(data, window, *args, **kwargs)
+        
+        def counting_atr(high, low, close, period=14, **kwargs):
+            atr_periods.append(period)
+            return original_atr(high, low, close, period, **kwargs)
+        
+        monkeypatch.setattr(indicator_registry, 'ema', counting_ema)
+        monkeypatch.setattr(indicator_registry, 'atr', counting_atr)
+        df = self.create_df()
+        df['High'] = df['Close'] + 1
+        df['Low'] = df['Close'] - 1
+        result_df = compute_indicators(df, [
+            {"id": "EMA", "params": {"period": 20}},
+            {"id": "ATR", "params": {"period": 20}},
+            {"id": "Keltner", "params": {"period": 20, "multiplier": 2.0}}
+        ])
+        
+        assert ema_periods == [20]
+        assert atr_periods == [20]
+        upper, middle, lower = keltner_channels(df['High'], df['Low'], df['Close'], 20, 2.0)
+        pd.testing.assert_series_equal(result_df['KC_Upper_20_2.0'], upper, check_names=False)
+        pd.testing.assert_series_equal(result_df['KC_Middle_20'], middle, check_names=False)
+        pd.testing.assert_series_equal(result_df['KC_Lower_20_2.0'], lower, check_names=False)
+    
+    def test_changed_data_misses(self, counted_rsi):
+        """Test that different input data is recomputed."""
+        indicators = [{"id": "RSI", "params": {"period": 14}}]
+        compute_indicators(self.create_df(seed=0), indicators)
+        compute_indicators(self.create_df(seed=1), indicators)
+        
+        assert len(counted_rsi) == 2
+    
+    def test_int_and_float_params_cached_separately(self):
+        """Test that params equal in value but not type (2 vs 2.0) get their own columns."""
+        df = self.create_df()
+        
+        as_int = compute_indicators(df, [{"id": "Bollinger", "params": {"num_std": 2}}])
+        as_float = compute_indicators(df, [{"id": "Bollinger", "params": {"num_std": 2.0}}])
+        
+        assert 'BB_Upper_20_2' in as_int.columns
+        assert 'BB_Upper_20_2.0' in as_float.columns
+        assert 'BB_Upper_20_2' not in as_float.columns
+        conditions = evaluate_all_conditions(df, [{"id": "Bollinger", "params": {"num_std": 2.0}}])
+        assert len(conditions['bb_price_squeeze']) == len(df)
+    
+    def test_lazy_evaluation_uses_cache(self, counted_rsi):
+        """Test that evaluators computing missing columns share the cache and leave the input alone."""
+        df = self.create_df()
+        indicators = [{"id": "RSI", "params": {"period": 14}}]
+        
+        first = evaluate_all_conditions(df, indicators)
+        second = evaluate_all_conditions(df.copy(), indicators)
+        
+        assert len(counted_rsi) == 1
+        assert list(df.columns) == ['Close']
+        pd.testing.assert_series_equal(first['rsi_oversold'], second['rsi_oversold'])
 
 
 class TestEdgeCases:
@@ -316,6 +662,24 @@ class TestEdgeCases:
         conditions = evaluate_all_conditions(df, [])
         assert conditions == {}
     
+    def test_compute_indicators_leaves_input_unchanged(self):
+        """Test that indicators are added to a new frame and stale columns are replaced."""
+        df = pd.DataFrame({
+            'Date': pd.date_range('2020-01-01', periods=40, freq='D'),
+            'Close': np.linspace(100, 140, 40),
+            'SMA_5': np.zeros(40)
+        }).set_index('Date')
+        original = df.copy()
+        
+        result_df = compute_indicators(df, [
+            {"id": "SMA", "params": {"period": 5}},
+            {"id": "EMA", "params": {"period": 10}}
+        ])
+        
+        pd.testing.assert_frame_equal(df, original)
+        assert list(result_df.columns) == ['Close', 'SMA_5', 'EMA_10']
+        pd.testing.assert_series_equal(result_df['SMA_5'], df['Close'].rolling(5).mean(), check_names=False)
+    
     def test_insufficient_data_for_indicators(self):
         """Test handling of insufficient data for indicators."""
         # Create very small dataset
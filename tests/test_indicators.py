@@ -14,7 +14,7 @@ from pathlib import Path
 # Add backend to path
 sys.path.append(str(Path(__file__).parent.parent / "backend"))
 
-from core.indicators import sma, ema, rsi, bollinger_bands, macd
+from core.indicators import sma, ema, rsi, bollinger_bands, macd, atr, parabolic_sar, obv
 
 
 class TestSMA:
@@ -87,6 +87,21 @@ class TestEMA:
         # Second value should use custom alpha
         expected_2 = alpha * 2 + (1 - alpha) * 1.0
         assert abs(result.iloc[1] - expected_2) < 1e-10
+    
+    def test_ema_matches_pandas_ewm(self):
+        """Test EMA matches pandas ewm(adjust=False), with and without NaN."""
+        np.random.seed(0)
+        data = pd.Series(np.random.normal(100, 5, 200), name='Close')
+        gappy = data.copy()
+        gappy.iloc[[0, 50, 51]] = np.nan
+        leading = data.copy()
+        leading.iloc[:3] = np.nan
+        
+        for series in (data, gappy, leading):
+            expected = series.ewm(alpha=2 / 21, adjust=False).mean()
+            pd.testing.assert_series_equal(ema(series, 20), expected, rtol=1e-12)
+        
+        assert ema(pd.Series([], dtype=float), 20).empty
 
 
 class TestRSI:
@@ -123,6 +138,19 @@ class TestRSI:
         # RSI should be high (close to 100) for strong uptrend
         valid_values = result.dropna()
         assert valid_values.iloc[-1] > 70  # Should be in overbought territory
+    
+    def test_rsi_matches_wilder_smoothing(self):
+        """Test RSI against the diff/ewm reference, including NaN prices."""
+        np.random.seed(1)
+        data = pd.Series(np.random.normal(0, 2, 100).cumsum() + 100, name='Close')
+        data.iloc[[10, 11, 40]] = np.nan
+        
+        delta = data.diff()
+        avg_gains = delta.where(delta > 0, 0).ewm(alpha=1/14, adjust=False).mean()
+        avg_losses = (-delta.where(delta < 0, 0)).ewm(alpha=1/14, adjust=False).mean()
+        expected = 100 - (100 / (1 + avg_gains / avg_losses))
+        
+        pd.testing.assert_series_equal(rsi(data, 14), expected, rtol=1e-12)
 
 
 class TestBollingerBands:
@@ -187,6 +215,55 @@ class TestMACD:
         assert histogram[valid_hist_indices].equals(expected_histogram[valid_hist_indices])
 
 
+class TestATR:
+    """Test Average True Range and Parabolic SAR calculations."""
+    
+    def test_atr_matches_true_range_ema(self):
+        """Test ATR against the pandas true range / EMA reference."""
+        np.random.seed(2)
+        close = pd.Series(np.random.normal(0, 1, 100).cumsum() + 100)
+        high = close + np.random.uniform(0, 1, 100)
+        low = close - np.random.uniform(0, 1, 100)
+        
+        true_range = pd.concat(
+            [high - low, abs(high - close.shift(1)), abs(low - close.shift(1))], axis=1
+        ).max(axis=1)
+        expected = true_range.ewm(span=14, adjust=False).mean()
+        
+        pd.testing.assert_series_equal(atr(high, low, close, 14), expected, rtol=1e-12)
+    
+    def test_parabolic_sar_uptrend(self):
+        """Test that SAR starts at the first low and trails below a rising market."""
+        close = pd.Series(np.linspace(100, 130, 30))
+        high = close + 1
+        low = close - 1
+        sar = parabolic_sar(high, low, close)
+        
+        assert len(sar) == len(close)
+        assert sar.iloc[0] == low.iloc[0]
+        assert (sar.iloc[2:] < low.iloc[2:]).all()
+        assert sar.is_monotonic_increasing
+
+
+class TestOBV:
+    """Test On-Balance Volume calculations."""
+    
+    def test_obv_basic(self):
+        """Test that volume is added on up closes and subtracted on down closes."""
+        close = pd.Series([10.0, 11.0, 10.5, 10.5, 12.0])
+        volume = pd.Series([100.0, 200.0, 50.0, 75.0, 25.0])
+        
+        assert obv(close, volume).tolist() == [100.0, 300.0, 250.0, 250.0, 275.0]
+    
+    def test_obv_nan_close_leaves_value_unchanged(self):
+        """Test that a bar compared against a NaN close carries OBV forward."""
+        close = pd.Series([10.0, np.nan, 11.0, 12.0])
+        volume = pd.Series([100.0, 200.0, 50.0, 75.0])
+        
+        assert obv(close, volume).tolist() == [100.0, 100.0, 100.0, 175.0]
+        assert obv(pd.Series([], dtype=float), pd.Series([], dtype=float)).empty
+
+
 class TestIndicatorEdgeCases:
     """Test edge cases for all indicators."""
     